@@ -6,11 +6,15 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import contextlib
 import io
 import logging
+import tempfile
 import unittest
+from logging import handlers
 
 from treepagegenerator import logger
+from treepagegenerator.utils import read_data
 
 
 class LoggerTest(unittest.TestCase):
@@ -43,3 +47,39 @@ class LoggerTest(unittest.TestCase):
         self.logger.info("\r\n\r\n\r\n")
         msg = self.buffer.getvalue()
         self.assertEqual(msg, "\r\n\r\n\r\n\n")
+
+
+class ConfigureTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.log_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.root_level = logging.root.level
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        logger.release()
+        logging.root.setLevel(self.root_level)
+        self.log_dir.cleanup()
+
+    def test_configure_twice(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            logger.configure(log_dir=self.log_dir.name)
+            logger.configure(log_dir=self.log_dir.name)
+        queue_handlers = [item for item in logging.root.handlers if isinstance(item, handlers.QueueHandler)]
+        self.assertEqual(len(queue_handlers), 1)
+
+        logging.getLogger(__name__).info("configured message")
+        logger.release()
+        log_content = read_data(logger.output_file)
+        self.assertEqual(log_content.count("configured message"), 1)
+
+    def test_release_flushes_records(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            logger.configure(log_dir=self.log_dir.name, log_level=logging.INFO)
+            log = logging.getLogger(__name__)
+            for index in range(5000):
+                log.info("burst message %s", index)
+            logger.release()
+        log_content = read_data(logger.output_file)
+        self.assertEqual(log_content.count("burst message"), 5000)
+        self.assertIn("burst message 4999\n", log_content)
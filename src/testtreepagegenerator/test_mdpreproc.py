@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2024, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import importlib.util
+import os
+import unittest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+## script is not part of package - load it directly from tools directory
+def load_mdpreproc():
+    script_path = os.path.join(SCRIPT_DIR, os.pardir, os.pardir, "tools", "mdpreproc.py")
+    spec = importlib.util.spec_from_file_location("mdpreproc", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mdpreproc = load_mdpreproc()
+
+
+class ParseAttributesTest(unittest.TestCase):
+    def test_double_quoted(self):
+        attrs = mdpreproc.parse_attributes('<!-- insertstart include="doc/file.md" pre="```" -->')
+        self.assertEqual(attrs, {"@include": "doc/file.md", "@pre": "```"})
+
+    def test_single_quoted(self):
+        attrs = mdpreproc.parse_attributes("<!-- insertstart include='doc/file.md' post='\"end\"' -->")
+        self.assertEqual(attrs, {"@include": "doc/file.md", "@post": '"end"'})
+
+    def test_entities(self):
+        attrs = mdpreproc.parse_attributes('<!-- insertstart pre="&lt;a&gt; &amp; &quot;b&quot; &#39;c&#39;" -->')
+        self.assertEqual(attrs, {"@pre": "<a> & \"b\" 'c'"})
+
+    def test_whitespace_around_equals(self):
+        attrs = mdpreproc.parse_attributes('<!--insertstart include = "a.md"\tpre=\n"x"-->')
+        self.assertEqual(attrs, {"@include": "a.md", "@pre": "x"})
+
+    def test_whitespace_in_value(self):
+        attrs = mdpreproc.parse_attributes('<!-- insertstart pre="a\r\nb\nc\td" -->')
+        self.assertEqual(attrs, {"@pre": "a b c d"})
+
+    def test_no_attributes(self):
+        attrs = mdpreproc.parse_attributes("<!-- insertend -->")
+        self.assertEqual(attrs, {})
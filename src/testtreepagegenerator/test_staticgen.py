@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2024, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+import shutil
+import unittest
+
+from treepagegenerator.generator import staticgen
+from treepagegenerator.generator.dataloader import DataLoader, DefItem
+from treepagegenerator.generator.staticgen import (
+    build_find_automaton,
+    compile_find_pattern,
+    find_all,
+    find_all_defs,
+    generate_graph,
+    get_graph_svg,
+    iter_words_matches,
+    mark_svg_active_node,
+)
+
+
+class FindAllTest(unittest.TestCase):
+    def test_not_found(self):
+        self.assertEqual(find_all("abc def", "xyz"), [])
+
+    def test_whole_words(self):
+        self.assertEqual(find_all("ab abc xab ab", "ab"), [0, 11])
+
+    def test_subword(self):
+        self.assertEqual(find_all("ab abc xab ab", "ab", match_subword=True), [0, 3, 8, 11])
+
+    def test_non_letter_boundary(self):
+        self.assertEqual(find_all("(ab)_ab 1ab2", "ab"), [1, 5, 9])
+
+    def test_overlapping(self):
+        self.assertEqual(find_all("aaaa", "aa", match_subword=True), [0, 1, 2])
+        self.assertEqual(find_all("aaaa", "aa"), [])
+
+
+class CompileFindPatternTest(unittest.TestCase):
+    def test_longest_match(self):
+        pattern = compile_find_pattern(("ab", "abc"), match_subword=True)
+        found = [(item.start(), item.group(1)) for item in pattern.finditer("abcd")]
+        self.assertEqual(found, [(0, "abc")])
+
+    def test_longest_whole_word(self):
+        pattern = compile_find_pattern(("ab", "abc"))
+        found = [(item.start(), item.group(1)) for item in pattern.finditer("abc abd ab")]
+        self.assertEqual(found, [(0, "abc"), (8, "ab")])
+
+
+class IterWordsMatchesTest(unittest.TestCase):
+    def check_matcher(self, matcher):
+        found = list(iter_words_matches("abc abd ab xab ab-cd", matcher))
+        self.assertEqual(found, [(0, "abc"), (8, "ab"), (15, "ab-cd")])
+
+    def test_pattern(self):
+        self.check_matcher(compile_find_pattern(("ab", "abc", "ab-cd")))
+
+    @unittest.skipIf(staticgen.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton(self):
+        self.check_matcher(build_find_automaton(("ab", "abc", "ab-cd")))
+
+
+class FindAllDefsTest(unittest.TestCase):
+    def test_longest_first(self):
+        def_short = DefItem("ab", None, casesensitive=True)
+        def_long = DefItem("ab cd", None, casesensitive=True)
+        found = find_all_defs("ab cd ab", [def_short, def_long])
+        self.assertEqual(found, [(0, def_long), (6, def_short)])
+
+    def test_overlapping(self):
+        def_first = DefItem("ab cd", None, casesensitive=True)
+        def_second = DefItem("cd ef", None, casesensitive=True)
+        found = find_all_defs("ab cd ef", [def_first, def_second])
+        self.assertEqual(found, [(0, def_first)])
+
+    def test_case_insensitive(self):
+        def_item = DefItem("ab", None, casesensitive=False)
+        found = find_all_defs("Ab AB xAB", [def_item])
+        self.assertEqual(found, [(0, def_item), (3, def_item)])
+
+    def test_case_sensitive(self):
+        def_item = DefItem("Ab", None, casesensitive=True)
+        found = find_all_defs("Ab AB ab", [def_item])
+        self.assertEqual(found, [(0, def_item)])
+
+
+## fragment of SVG in format rendered by Graphviz
+GRAPH_SVG = """\
+<g id="graph0" class="graph" transform="scale(1 1) rotate(0) translate(4 112)">
+<title>model_graph</title>
+<polygon fill="white" stroke="none" points="-4,4 -4,-112 130,-112 130,4 -4,4"/>
+<g id="node1" class="node">
+<title>Lasius niger</title>
+<ellipse fill="white" stroke="black" cx="99" cy="-18" rx="27" ry="18"/>
+</g>
+<g id="node2" class="node">
+<title>X&#45;ray &amp; &#39;Y&#39;</title>
+<g id="a_node2"><a xlink:href="page/x.html" xlink:title="X&#45;ray &amp; &#39;Y&#39;">
+<ellipse fill="white" stroke="black" cx="27" cy="-18" rx="27" ry="18"/>
+</a>
+</g>
+</g>
+<g id="edge1" class="edge">
+<title>model_graph&#45;&gt;Lasius niger</title>
+<path fill="none" stroke="black" d="M63,-72C63,-64 63,-55 63,-46"/>
+</g>
+<g id="node3" class="node">
+<title>model_graph</title>
+<ellipse fill="white" stroke="black" cx="63" cy="-90" rx="27" ry="18"/>
+</g>
+</g>
+"""
+
+
+class MarkSvgActiveNodeTest(unittest.TestCase):
+    def test_plain_id(self):
+        marked = mark_svg_active_node(GRAPH_SVG, "Lasius niger")
+        expected = GRAPH_SVG.replace('fill="white" stroke="black" cx="99"', 'fill="yellow" stroke="black" cx="99"')
+        self.assertEqual(marked, expected)
+
+    def test_escaped_id(self):
+        marked = mark_svg_active_node(GRAPH_SVG, "X-ray & 'Y'")
+        expected = GRAPH_SVG.replace('fill="white" stroke="black" cx="27"', 'fill="yellow" stroke="black" cx="27"')
+        self.assertEqual(marked, expected)
+
+    def test_missing_id(self):
+        self.assertIsNone(mark_svg_active_node(GRAPH_SVG, "Lasius"))
+
+    def test_graph_title(self):
+        marked = mark_svg_active_node(GRAPH_SVG, "model_graph")
+        expected = GRAPH_SVG.replace('fill="white" stroke="black" cx="63"', 'fill="yellow" stroke="black" cx="63"')
+        self.assertEqual(marked, expected)
+
+    def test_edge_title(self):
+        self.assertIsNone(mark_svg_active_node(GRAPH_SVG, "model_graph->Lasius niger"))
+
+
+## data loader providing only model data used by generate_graph() - no config files are read
+def create_graph_data_loader():
+    data_loader = DataLoader.__new__(DataLoader)
+    data_loader.model_data = {
+        "data": {
+            "1": [{"next": "2", "target": None}, {"next": "a-b", "target": None}],
+            "2": [{"next": None, "target": ["Myrmica rubra", None]}, {"next": None, "target": ["X & 'Y'", None]}],
+            "a-b": [{"next": None, "target": ["model_graph", None]}, {"next": None, "target": ['Z "<z>"', None]}],
+        },
+    }
+    return data_loader
+
+
+@unittest.skipIf(shutil.which("dot") is None, "Graphviz not installed")
+class MarkRenderedSvgActiveNodeTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.data_loader = create_graph_data_loader()
+
+    def render_svg(self, active_item):
+        svg_content = get_graph_svg(generate_graph(self.data_loader, active_item))
+        return staticgen.SVG_SIZE_REGEX.sub("<svg", svg_content)
+
+    def test_nodes(self):
+        base_svg = self.render_svg(None)
+        for node in ["1", "2", "a-b", "Myrmica rubra", "X & 'Y'", "model_graph", 'Z "<z>"']:
+            with self.subTest(node=node):
+                self.assertEqual(mark_svg_active_node(base_svg, node), self.render_svg(node))
@@ -0,0 +1,30 @@
+#
+# Copyright (c) 2024, Arkadiusz Netczuk <dev.arnet@gmail.com>
+# All rights reserved.
+#
+# This source code is licensed under the BSD 3-Clause license found in the
+# LICENSE file in the root directory of this source tree.
+#
+
+# ruff: noqa: ICN001
+
+import datetime
+import unittest
+
+from treepagegenerator.utils import string_iso_to_date, string_isoauto_to_date
+
+
+class StringIsoAutoToDateTest(unittest.TestCase):
+    def test_zulu(self):
+        item_date = string_isoauto_to_date("2024-06-04T14:23:41Z")
+        self.assertEqual(item_date.tzinfo, datetime.UTC)
+        self.assertEqual(item_date, string_iso_to_date("2024-06-04T14:23:41+00:00"))
+
+    def test_zulu_fraction(self):
+        item_date = string_isoauto_to_date("2024-06-04T14:23:41.077Z")
+        self.assertEqual(item_date.tzinfo, datetime.UTC)
+        self.assertEqual(item_date, string_iso_to_date("2024-06-04T14:23:41.077+00:00"))
+
+    def test_offset(self):
+        item_date = string_isoauto_to_date("2024-06-04T16:23:41+02:00")
+        self.assertEqual(item_date, string_isoauto_to_date("2024-06-04T14:23:41Z"))
@@ -6,11 +6,13 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import functools
 import json
 import logging
 import math
 import os
 import shutil
+from pathlib import Path
 from typing import Any
 
 import validators
@@ -128,8 +130,10 @@ class DataLoader:
         self.nav_dict: NavDict = self._load_nav_dict()
 
         ## key: characteristic id
-        ## value: list of species
-        self.potential_species: dict[str, list[str]] = self._load_potential_species()
+        ## value: sorted species
+        self.potential_species: dict[str, tuple[str, ...]] = self._load_potential_species()
+        ## cached result of get_all_species()
+        self._all_species: list[str] = None
 
         ## [  defs_dict: {  "defs": [ str ]
         ##                  "label": str
@@ -140,6 +144,9 @@ class DataLoader:
         ##               }
         ## ]
         self.defs_list: list[dict[str, Any]] = self._load_all_defs()
+        ## cached results of get_all_defs() and get_defs_dict()
+        self._all_defs: list[DefItem] = None
+        self._defs_dict: dict[str, Any] = None
 
         self.translation_dict = self._load_transaltion()
 
@@ -161,7 +168,7 @@ class DataLoader:
         model_data = self.model_data.get("data")
         return NavDict(model_data)
 
-    def _load_potential_species(self) -> dict[str, list[str]]:
+    def _load_potential_species(self) -> dict[str, tuple[str, ...]]:
         model_data = self.model_data.get("data")
 
         ## get leaves
@@ -201,7 +208,8 @@ class DataLoader:
             if prev_keys:
                 leaves_list.extend(prev_keys)
 
-        return potential_species
+        ## sort once - lists are presented in order on many pages
+        return {key: tuple(sorted(species)) for key, species in potential_species.items()}
 
     def _load_transaltion(self) -> dict[str, str]:
         if not self.translation_path:
@@ -326,6 +334,13 @@ class DataLoader:
                     leaves_list.append(target_item[0])
         return leaves_list
 
+    ## sorted list of all species (targets) of the model
+    def get_all_species(self) -> list[str]:
+        if self._all_species is None:
+            species_set = {species for species_list in self.potential_species.values() for species in species_list}
+            self._all_species = sorted(species_set)
+        return self._all_species
+
     def get_target(self, item_id, desc_index):
         model_data = self.model_data.get("data")
         item_data = model_data.get(item_id)
@@ -350,6 +365,11 @@ class DataLoader:
         # print("total_count:", total_count)
 
     def get_all_defs(self) -> list[DefItem]:
+        if self._all_defs is None:
+            self._all_defs = self._prepare_all_defs()
+        return self._all_defs
+
+    def _prepare_all_defs(self) -> list[DefItem]:
         if not self.defs_list:
             return []
         defs_set: set[DefItem] = set()
@@ -372,6 +392,11 @@ class DataLoader:
     ##                      ]
     ##            }
     def get_defs_dict(self) -> dict[str, Any]:
+        if self._defs_dict is None:
+            self._defs_dict = self._prepare_defs_dict()
+        return self._defs_dict
+
+    def _prepare_defs_dict(self) -> dict[str, Any]:
         if not self.defs_list:
             return {}
         ret_dict: dict[str, Any] = {}
@@ -423,7 +448,16 @@ def get_translation(translation_dict: dict[str, Any], key: str, group: str = Non
 
 
 def is_url(value):
-    return validators.url(value)
+    ## every URL accepted by validator contains scheme separator - skip validation of other values
+    if not isinstance(value, str) or "://" not in value:
+        return False
+    return validate_url(value)
+
+
+## the same keys and values are checked for many pages
+@functools.lru_cache(maxsize=4096)
+def validate_url(value: str) -> bool:
+    return bool(validators.url(value))
 
 
 # ================================================================
@@ -434,12 +468,12 @@ def copy_image(source_path, dest_path, *, resize=False):
     os.makedirs(parts[0], exist_ok=True)
 
     if not resize:
-        shutil.copyfile(source_path, dest_path, follow_symlinks=True)
+        copy_file_if_changed(source_path, dest_path)
         return
 
     parts = os.path.splitext(source_path)
     if parts[1] in (".svg"):
-        shutil.copyfile(source_path, dest_path, follow_symlinks=True)
+        copy_file_if_changed(source_path, dest_path)
         return
 
     with Image.open(source_path) as src_img:
@@ -454,3 +488,17 @@ def copy_image(source_path, dest_path, *, resize=False):
             new_img = src_img.resize((width, height), Image.LANCZOS)  # pylint: disable=no-member
             _LOGGER.debug("image %s resized from %s to %s by factor %s", dest_path, old_size, src_img.size, root_factor)
         new_img.save(dest_path, optimize=True, quality=50)
+
+
+## copy file unless destination is already up to date (the same size and not older than source)
+## copyfile() itself uses zero-copy sendfile() where available
+def copy_file_if_changed(source_path, dest_path):
+    try:
+        source_stat = Path(source_path).stat()
+        dest_stat = Path(dest_path).stat()
+        if dest_stat.st_size == source_stat.st_size and dest_stat.st_mtime >= source_stat.st_mtime:
+            return
+    except OSError:
+        ## destination does not exist
+        pass
+    shutil.copyfile(source_path, dest_path, follow_symlinks=True)
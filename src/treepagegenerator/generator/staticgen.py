@@ -8,20 +8,42 @@
 #
 
 import base64
+import functools
+import hashlib
+import heapq
 import io
 import logging
 import os
 import re
-import shutil
-from typing import Any
+import subprocess  # nosec
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from PIL import Image
-from showgraph.graphviz import Graph, set_node_style
 
 from treepagegenerator.data import DATA_DIR
-from treepagegenerator.generator.dataloader import DataLoader, DefItem, copy_image
+from treepagegenerator.generator.dataloader import DataLoader, DefItem, copy_file_if_changed, copy_image
 from treepagegenerator.generator.utils import HTML_LICENSE
-from treepagegenerator.utils import read_data, write_data
+from treepagegenerator.utils import read_data, write_data_if_changed
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+try:
+    ## SIMD accelerated implementation of base64
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    ## multi-pattern search in single pass over text
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 SCRIPT_DIR = os.path.dirname(__file__)
@@ -32,7 +54,7 @@ logging.getLogger("PIL").setLevel(logging.WARNING)
 
 
 # ruff: noqa: PLR0913
-def generate_pages(
+def generate_pages(  # pylint: disable=R0913
     config_path,
     output_path,
     output_index_name=None,
@@ -41,6 +63,8 @@ def generate_pages(
     embedimages=False,
     singlepagemode=False,
     allowjs=False,
+    jobs=1,
+    prettyhtml=False,
 ):
     gen = StaticGenerator()
     data_loader = DataLoader(config_path)
@@ -52,6 +76,8 @@ def generate_pages(
         embedimages=embedimages,
         singlepagemode=singlepagemode,
         allowjs=allowjs,
+        jobs=jobs,
+        prettyhtml=prettyhtml,
     )
 
     # check_defs_repetitions(data_loader)
@@ -76,8 +102,28 @@ def check_defs_repetitions(data_loader: DataLoader):
 
 LABEL_BACK_TO_MAIN = "Main page"
 
+## common structure of all pages
+PAGE_TEMPLATE = f"""\
+<!DOCTYPE html>
+<html>
+{HTML_LICENSE}
+
+<head>
+    <title>{{title}}</title>
+    <meta http-equiv="Content-Type" content="text/html; charset=utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />    <!-- for mobile web browser to fix font sizes -->
+    {{css}}
+    {{images}}
+</head>
+<body{{body_onload}}>
+{{content}}
+</body>
+</html>
+"""
+
 
-class BaseGenerator:
+## most of attributes are caches of data shared between pages
+class BaseGenerator:  # pylint: disable=R0902
     def __init__(self):  # noqa: F811
         self.total_count = 0
         self.page_counter = 0
@@ -90,14 +136,61 @@ class BaseGenerator:
         self.embedimages = False
         self.singlepagemode = False
         self.allowjs = False  ## mostly for single page mode
+        self.jobs = 1  ## number of processes generating pages
+        self.image_threads = os.cpu_count() or 1  ## number of threads encoding embedded images
+        self.prettyhtml = False  ## indent nested HTML content
 
         self.data_loader: DataLoader = None
 
         self.page_id = None
         self.out_path = None
+        self.out_dir = None  ## directory of out_path
 
         ## buffer for single page mode
-        self._content = ""
+        self._content_parts: list[str] = []
+
+        ## key: hash of encoded image data
+        ## value: base64 string of the data
+        self._base64_cache: dict[str, str] = {}
+
+        ## key: source image path
+        ## value: path of image in output directory
+        self._photo_dest_cache: dict[str, str] = {}
+
+        ## key: pair (source image path, page directory)
+        ## value: image tag
+        self._img_tag_cache: dict[tuple[str, str], str] = {}
+
+        ## key: pair (image path, modification time)
+        ## value: CSS class with embedded image
+        self._image_css_cache: dict[tuple[str, float], str] = {}
+
+        ## key: keyword (definition value)
+        ## value: list of model items mentioning keyword in descriptions
+        self._mentioned_index: dict[str, list[str]] = None
+
+        ## embedded styles (read once, the same for all pages)
+        self._embedded_css: str = None
+
+        ## key: description text
+        ## value: places of definitions found in text (independent of page)
+        self._description_places: dict[str, list[tuple[int, DefItem]]] = {}
+
+        ## definitions patterns compiled once (see prepare_defs_patterns())
+        self._defs_patterns = None
+
+        ## pairs (page id, prepared descriptions) - links in descriptions point to current page
+        ## so prepared model descriptions are kept only for items used on current page
+        self._model_texts_cache: tuple[str, dict[str, Any]] = None
+        self._def_texts_cache: tuple[str, dict[str, Any]] = None
+
+        ## key: directory of page
+        ## value: beginning of "back to" section (link to main page)
+        self._back_to_prefix: dict[str, str] = {}
+
+        ## keywords used in the whole model and their images (the same for all pages)
+        self._all_keywords: list[DefItem] = None
+        self._all_keywords_images: list[str] = None
 
     def set_root_dir(self, output_path):
         self.out_root_dir = output_path
@@ -114,25 +207,57 @@ class BaseGenerator:
 
     def set_out_path(self, output_path):
         self.out_path = output_path
+        self.out_dir = os.path.dirname(output_path)
         self.page_id = self.create_page_id(output_path)
 
     def get_content(self) -> str:
-        return self._content
+        return "".join(self._content_parts)
+
+    ## join buffered content and release parts, so only one copy of content is kept
+    def pop_content(self) -> str:
+        content = self.get_content()
+        self._content_parts = []
+        return content
 
     def prepare_model_item_descr(self):
-        model_texts = {}
         model = self.data_loader.model_data
         model_data: dict[str, Any] = model.get("data", {})
-        for item_id, desc_list in model_data.items():
+        return {item_id: self.prepare_item_descr(item_id) for item_id in model_data}
+
+    ## returns prepared descriptions of single model item
+    def prepare_item_descr(self, item_id):
+        if self._model_texts_cache is None or self._model_texts_cache[0] != self.page_id:
+            self._model_texts_cache = (self.page_id, {})
+        model_texts = self._model_texts_cache[1]
+        prepared_list = model_texts.get(item_id)
+        if prepared_list is None:
+            model = self.data_loader.model_data
+            model_data: dict[str, Any] = model.get("data", {})
             prepared_list = []
-            for val in desc_list:
+            for val in model_data[item_id]:
                 value = val.get("description")
                 desc, desc_keys = self._prepare_description(value)
                 prepared_list.append((val, desc, desc_keys))
             model_texts[item_id] = prepared_list
-        return model_texts
+        return prepared_list
+
+    ## returns model items (in model order) mentioning each keyword (definition value) in descriptions
+    def get_mentioned_index(self) -> dict[str, list[str]]:
+        if self._mentioned_index is None:
+            model_texts = self.prepare_model_item_descr()
+            self._mentioned_index = {}
+            for item_id, prep_desc_list in model_texts.items():
+                item_keys: set[str] = set()
+                for prep_item in prep_desc_list:
+                    _desc_text, _desc, desc_keys = prep_item
+                    item_keys.update(item.defvalue for item in desc_keys)
+                for keyword in item_keys:
+                    self._mentioned_index.setdefault(keyword, []).append(item_id)
+        return self._mentioned_index
 
     def _prepare_dictionary_item_descr(self):
+        if self._def_texts_cache is not None and self._def_texts_cache[0] == self.page_id:
+            return self._def_texts_cache[1]
         def_texts = {}
         defs_dict: dict[str, Any] = self.data_loader.get_defs_dict()
         for keyword, keyword_data_list in defs_dict.items():
@@ -145,21 +270,24 @@ class BaseGenerator:
                 def_desc, def_keys = self._prepare_description(def_text)
                 prepared_list.append((def_text, def_desc, def_keys))
             def_texts[keyword] = prepared_list
+        self._def_texts_cache = (self.page_id, def_texts)
         return def_texts
 
     def prepare_css(self, page_dir):
         if not self.embedcss:
             css_target_path = os.path.join(self.out_root_dir, "styles.css")
-            css_rel_path = os.path.relpath(css_target_path, page_dir)
+            css_rel_path = cached_relpath(css_target_path, page_dir)
             return f"""<link rel="stylesheet" type="text/css" href="{css_rel_path}">"""
 
         ## embed
-        css_source_path = os.path.join(DATA_DIR, "styles.css")
-        css_content = read_data(css_source_path)
-        return f"""<style>
+        if self._embedded_css is None:
+            css_source_path = os.path.join(DATA_DIR, "styles.css")
+            css_content = read_data(css_source_path)
+            self._embedded_css = f"""<style>
 {css_content}
     </style>
 """
+        return self._embedded_css
 
     def get_image_paths_from_defs(self, keywords_list: list[DefItem]):
         ret_list = []
@@ -177,13 +305,26 @@ class BaseGenerator:
         return ret_list
 
     def prepare_photo_dest_path(self, source_path):
-        base_path = get_path_components(source_path, 2)  ## filename with dir name
-        base_path = prepare_filename(base_path)
-        return os.path.join(self.out_img_dir, base_path)
+        dest_path = self._photo_dest_cache.get(source_path)
+        if dest_path is None:
+            base_path = get_path_components(source_path, 2)  ## filename with dir name
+            base_path = prepare_filename(base_path)
+            dest_path = os.path.join(self.out_img_dir, base_path)
+            self._photo_dest_cache[source_path] = dest_path
+        return dest_path
 
     def _prepare_img_tag(self, photo_path):
         if not photo_path:
             return None
+        ## tag depends only on image and directory of page
+        cache_key = (photo_path, self.out_dir)
+        if cache_key in self._img_tag_cache:
+            return self._img_tag_cache[cache_key]
+        img_tag = self._generate_img_tag(photo_path)
+        self._img_tag_cache[cache_key] = img_tag
+        return img_tag
+
+    def _generate_img_tag(self, photo_path):
         dest_img_path = self.prepare_photo_dest_path(photo_path)
         if not dest_img_path:
             return None
@@ -191,45 +332,43 @@ class BaseGenerator:
         if not self.embedimages:
             img_rel_path = None
             if self.singlepagemode:
-                img_rel_path = os.path.relpath(dest_img_path, self.out_root_dir)
+                img_rel_path = cached_relpath(dest_img_path, self.out_root_dir)
             else:
-                from_dir = os.path.dirname(self.out_path)
-                img_rel_path = os.path.relpath(dest_img_path, from_dir)
+                img_rel_path = cached_relpath(dest_img_path, self.out_dir)
             return f"""<img class="image" src="{img_rel_path}"/>"""
 
         ## embed
-        img_rel_path = os.path.relpath(dest_img_path, self.out_img_dir)
+        img_rel_path = cached_relpath(dest_img_path, self.out_img_dir)
         if not img_rel_path:
             return None
         image_id = prepare_image_id(img_rel_path)
         return f"""<div class="image {image_id}"></div>"""
 
     def _prepare_description(self, description) -> tuple[str, list[DefItem]]:
-        description_defs_list: list[DefItem] = self.data_loader.get_all_defs()
-        ret_descr = description
-        ret_keywords: list[DefItem] = []
-
-        places: list[tuple[int, DefItem]] = find_all_defs(description, description_defs_list)
-        places = sorted(places, key=lambda x: (x[0], -len(x[1].defvalue)))
-        places.reverse()
-        for place_item in places:
-            pos: int = place_item[0]
-            def_item: DefItem = place_item[1]
+        places: list[tuple[int, DefItem]] = self._description_places.get(description)
+        if places is None:
+            if self._defs_patterns is None:
+                description_defs_list: list[DefItem] = self.data_loader.get_all_defs()
+                self._defs_patterns = prepare_defs_patterns(description_defs_list)
+            places = list(iter_defs_matches(description, self._defs_patterns))
+            self._description_places[description] = places
+
+        ## places are ascending and do not overlap - copy text between them and wrap definitions
+        descr_parts = []
+        recent_end = 0
+        for pos, def_item in places:
             def_keyword = def_item.defvalue
-            def_len = len(def_keyword)
-            end_pos = pos + def_len
-
-            wrap_content = ret_descr[pos:end_pos]
+            end_pos = pos + len(def_keyword)
+            descr_parts.append(description[recent_end:pos])
+            wrap_content = description[pos:end_pos]
             wrap_content = self.gen_link(f"#{self.page_id}_{def_keyword}", wrap_content, "def_item")
-            ret_descr = ret_descr[:pos] + wrap_content + ret_descr[end_pos:]
-
-            # ## add suffix to def
-            # ret_descr = ret_descr[:end_pos] + "</a>" + ret_descr[end_pos:]
-            # ## add prefix to def
-            # ret_descr = ret_descr[:pos] + f"""<a href="#{def_keyword}" class="def_item">""" + ret_descr[pos:]
-
-            ret_keywords.append(def_item)
+            descr_parts.append(wrap_content)
+            recent_end = end_pos
+        descr_parts.append(description[recent_end:])
+        ret_descr = "".join(descr_parts)
 
+        ## keywords in order from the end of description
+        ret_keywords: list[DefItem] = [def_item for _pos, def_item in reversed(places)]
         return ret_descr, ret_keywords
 
     def prepare_images_css(self, source_image_path_list=None):
@@ -241,49 +380,84 @@ class BaseGenerator:
         source_image_path_list = list(set(source_image_path_list))
         source_image_path_list.sort()
 
-        img_class_list = []
-        for photo_path in source_image_path_list:
-            dest_img_path = self.prepare_photo_dest_path(photo_path)
-            if not dest_img_path:
-                continue
-            img_rel_path = os.path.relpath(dest_img_path, self.out_img_dir)
-            if not img_rel_path:
-                continue
-            image_id = prepare_image_id(img_rel_path)
+        ## resizing and encoding is done once per image file
+        cache_keys = [(photo_path, Path(photo_path).stat().st_mtime) for photo_path in source_image_path_list]
+        missing_keys = [key for key in cache_keys if key not in self._image_css_cache]
+        if missing_keys:
+            ## PIL releases GIL while resizing and encoding images
+            with ThreadPoolExecutor(max_workers=self.image_threads) as executor:
+                missing_css = executor.map(self._generate_image_css, [key[0] for key in missing_keys])
+                self._image_css_cache.update(zip(missing_keys, missing_css, strict=True))
+
+        img_class_list = [self._image_css_cache[key] for key in cache_keys]
+        img_class_list = [item for item in img_class_list if item]
+        css_content = "\n".join(img_class_list)
+        return f"""<style>
+/* images */
+{css_content}
+    </style>
+"""
 
-            # with open(photo_path, "rb") as image_file:
-            #     encoded_string = base64.b64encode(image_file.read())
-            #     img_text = encoded_string.decode('utf-8')
+    def _generate_image_css(self, photo_path):
+        dest_img_path = self.prepare_photo_dest_path(photo_path)
+        if not dest_img_path:
+            return None
+        img_rel_path = cached_relpath(dest_img_path, self.out_img_dir)
+        if not img_rel_path:
+            return None
+        image_id = prepare_image_id(img_rel_path)
 
-            img = Image.open(photo_path)
-            img_w, img_h = img.size
-            img_scale = 512 / img_w
+        # with open(photo_path, "rb") as image_file:
+        #     encoded_string = base64.b64encode(image_file.read())
+        #     img_text = encoded_string.decode('utf-8')
+
+        ## image is decoded once - generated CSS is cached by caller
+        with Image.open(photo_path) as img:
+            src_w, src_h = img.size
+            img_scale = 512 / src_w
             img_w = 512
-            img_h = int(img_h * img_scale)
-            newimg = img.resize((img_w, img_h), Image.LANCZOS)  # pylint: disable=E1101
+            img_h = int(src_h * img_scale)
+            newimg: Image.Image = img
+            if src_w > img_w:
+                ## reducing gap speeds up downscaling of large images (as in Image.thumbnail())
+                newimg = img.resize((img_w, img_h), Image.LANCZOS, reducing_gap=2.0)  # pylint: disable=E1101
+            ## small image is not upscaled - browser scales it
             buffered = io.BytesIO()
             newimg.save(buffered, img.format)
-            encoded_string = base64.b64encode(buffered.getvalue())
-            img_text = encoded_string.decode("utf-8")
+            img_mime = Image.MIME.get(img.format, "image/png")
+        img_text = self._encode_base64(buffered.getvalue())
 
-            css_content = f"""\
+        return f"""\
 .{image_id} {{
     width: {img_w}px;
     height: {img_h}px;
     background-repeat: no-repeat;
-    background-image: url(data:image/png;base64,{img_text});
+    background-size: 100%;
+    background-image: url(data:{img_mime};base64,{img_text});
 }}
-"""
-            img_class_list.append(css_content)
-
-        css_content = "\n".join(img_class_list)
-        return f"""<style>
-/* images */
-{css_content}
-    </style>
 """
 
-    def get_all_keywords(self):
+    def _encode_base64(self, data: bytes) -> str:
+        ## different images paths can point to the same content
+        data_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        encoded_text = self._base64_cache.get(data_hash)
+        if encoded_text is None:
+            encoded_text = encode_base64(data)
+            self._base64_cache[data_hash] = encoded_text
+        return encoded_text
+
+    def get_all_keywords(self) -> list[DefItem]:
+        if self._all_keywords is None:
+            self._all_keywords = self._find_all_keywords()
+        return self._all_keywords
+
+    def get_all_keywords_images(self) -> list[str]:
+        if self._all_keywords_images is None:
+            keywords_list = self.get_all_keywords()
+            self._all_keywords_images = self.get_image_paths_from_defs(keywords_list)
+        return self._all_keywords_images
+
+    def _find_all_keywords(self) -> list[DefItem]:
         model_texts = self.prepare_model_item_descr()
         keywords_list = []
         for prepare_desc_list in model_texts.values():
@@ -297,120 +471,125 @@ class BaseGenerator:
     def get_related_keywords(self, keywords_list: list[DefItem]) -> list[DefItem]:
         def_texts = self._prepare_dictionary_item_descr()
 
+        ## key: keyword (definition value)
+        ## value: DefItem
+        found_keywords: dict[str, DefItem] = {}
+        for item in keywords_list:
+            found_keywords.setdefault(item.defvalue, item)
+
         ## extend keywords list
-        counter = 0
-        found_keywords = {item.defvalue for item in keywords_list}
-        while counter < len(keywords_list):
-            keyword_def = keywords_list[counter]
-            keyword = keyword_def.defvalue
-            counter += 1
-            keyword_data_list = def_texts[keyword]
+        keywords_queue = deque(found_keywords.values())
+        while keywords_queue:
+            keyword_def = keywords_queue.popleft()
+            keyword_data_list = def_texts[keyword_def.defvalue]
             for def_item in keyword_data_list:
                 if not def_item:
                     continue
                 _def_raw, _def_desc, def_keys = def_item
                 for item in def_keys:
                     if item.defvalue not in found_keywords:
-                        found_keywords.add(item.defvalue)
-                        keywords_list.append(item)
-        def_key_list = sorted(set(keywords_list), key=lambda x: x.defvalue.lower())
+                        found_keywords[item.defvalue] = item
+                        keywords_queue.append(item)
 
-        ## remove duplicates
-        def_key_list = list({item.defvalue: item for item in def_key_list}.values())
-        def_key_list.sort(key=lambda x: x.get_label().lower())
+        def_key_list = list(found_keywords.values())
+        def_key_list.sort(key=lambda x: (x.get_label().lower(), x.defvalue.lower()))
         return def_key_list
 
     def prepare_back_to(self, model_item_id=None):
-        page_dir = os.path.dirname(self.out_path)
-        main_page_rel_path = os.path.relpath(self.out_index_path, page_dir)
-        prev_content = """<div class="main_section">Back to: """
-        back_link = self.gen_link(main_page_rel_path, LABEL_BACK_TO_MAIN)
-        link_list = [back_link]
-
+        page_dir = self.out_dir
+        prev_content = self._back_to_prefix.get(page_dir)
+        if prev_content is None:
+            ## link to main page is the same for all pages in directory
+            main_page_rel_path = cached_relpath(self.out_index_path, page_dir)
+            back_link = self.gen_link(main_page_rel_path, LABEL_BACK_TO_MAIN)
+            prev_content = f"""<div class="main_section">Back to: {back_link}"""
+            self._back_to_prefix[page_dir] = prev_content
+
+        parts = [prev_content]
         if model_item_id:
             nav_dict = self.data_loader.nav_dict
             prev_items = nav_dict.prev_id_list(model_item_id)
             if prev_items:
                 for prev in prev_items:
                     item = self.gen_link(f"{prev}.html", prev)
-                    link_list.append(item)
+                    parts.append(" | ")
+                    parts.append(item)
 
-        prev_content += " | ".join(link_list)
-        prev_content += "</div>"
-        return prev_content
+        parts.append("</div>")
+        return "".join(parts)
 
     # ruff: noqa: C901, PLR0915
     def prepare_defs_table(self, keywords_list: list[DefItem]):  # pylint: disable=R0914
         if not keywords_list:
             return None
 
-        page_dir = os.path.dirname(self.out_path)
+        page_dir = self.out_dir
 
         ## prepare "mentioned" list
-        model_texts = self.prepare_model_item_descr()
-        model_item_keys = {}
-        for item_id, prep_desc_list in model_texts.items():
-            item_keys = []
-            for prep_item in prep_desc_list:
-                _desc_text, _desc, desc_keys = prep_item
-                item_keys.extend([item.defvalue for item in desc_keys])
-            model_item_keys[item_id] = item_keys
+        mentioned_index = self.get_mentioned_index()
 
         def_texts = self._prepare_dictionary_item_descr()
 
         defs_dict: dict[str, Any] = self.data_loader.get_defs_dict()
-        keywords_content = ""
-        keywords_content += """<table>\n"""
-        keywords_content += """<tr class="title_row"> <th colspan="2">Keywords:</th> </tr>\n"""
+        keywords_parts = [
+            """<table>\n""",
+            """<tr class="title_row"> <th colspan="2">Keywords:</th> </tr>\n""",
+        ]
         for keyword_def in keywords_list:
             keyword = keyword_def.defvalue
             keyword_label = keyword_def.get_label()
-            def_name_id = prepare_page_id(f"{self.page_id}_{keyword}")
-            single_keyword_content = f"""<tr class="def_row">
-    <td class="def_item"><a name="{def_name_id}"></a>{keyword_label}</td>\n"""
-            single_keyword_content += """    <td> """
 
             keyword_data_list = defs_dict[keyword]
             keyword_text_list = def_texts[keyword]
-            keyword_defs_content = ""
-            for keyword_index, keyword_item in enumerate(keyword_data_list):
+            keyword_defs_parts = []
+            for keyword_item, def_item in zip(keyword_data_list, keyword_text_list, strict=True):
                 photo_path = keyword_item.get("image")
                 img_content = self._prepare_img_tag(photo_path)
                 description_content = keyword_item.get("description")
-                keyword_defs_content = """<div class="imgtile">\n"""
-                def_item = keyword_text_list[keyword_index]
+                keyword_defs_parts = ["""<div class="imgtile">\n"""]
                 if def_item:
                     _def_raw, def_text, _def_keys = def_item
-                    keyword_defs_content += f"""         <div>{def_text}</div>\n"""
+                    keyword_defs_parts.append(f"""         <div>{def_text}</div>\n""")
                 if img_content:
-                    keyword_defs_content += f"""         {img_content}\n"""
+                    keyword_defs_parts.append(f"""         {img_content}\n""")
                 if description_content:
-                    keyword_defs_content += f"""         <div>{description_content}</div>\n"""
-                keyword_defs_content += """         </div>\n"""
+                    keyword_defs_parts.append(f"""         <div>{description_content}</div>\n""")
+                keyword_defs_parts.append("""         </div>\n""")
 
             # ## prepare "mentioned" content
-            if keyword_defs_content:
-                single_keyword_content += keyword_defs_content
+            if keyword_defs_parts:
+                def_name_id = prepare_page_id(f"{self.page_id}_{keyword}")
+                keywords_parts.append(
+                    f"""<tr class="def_row">
+    <td class="def_item"><a name="{def_name_id}"></a>{keyword_label}</td>\n""",
+                )
+                keywords_parts.append("""    <td> """)
+                keywords_parts.extend(keyword_defs_parts)
 
                 mentioned_list = []
-                for item_id, item_desc_keys in model_item_keys.items():
-                    if keyword in item_desc_keys:
-                        item_path = os.path.join(self.out_page_dir, f"{item_id}.html")
-                        item_rel_path = os.path.relpath(item_path, page_dir)
-                        item_link = self.gen_link(item_rel_path, item_id)
-                        mentioned_list.append(item_link)
+                for item_id in mentioned_index.get(keyword, ()):
+                    item_path = os.path.join(self.out_page_dir, f"{item_id}.html")
+                    item_rel_path = cached_relpath(item_path, page_dir)
+                    item_link = self.gen_link(item_rel_path, item_id)
+                    mentioned_list.append(item_link)
                 if mentioned_list:
                     items_str = " ".join(mentioned_list)
-                    single_keyword_content += f"""         <div>Mentioned in: {items_str}</div>\n"""
+                    keywords_parts.append(f"""         <div>Mentioned in: {items_str}</div>\n""")
+
+                keywords_parts.append("""    </td>\n</tr>\n""")
 
-                single_keyword_content += """    </td>\n</tr>\n"""
-                keywords_content += single_keyword_content
+        keywords_parts.append("""</table>\n""")
+        keywords_content = "".join(keywords_parts)
 
-        keywords_content += """</table>\n"""
+        return self.indent_content(keywords_content)
 
-        keywords_content = keywords_content.replace("\n", "\n    ")
-        keywords_content = keywords_content.strip()
-        return "    " + keywords_content
+    ## indents nested content - only for readability of generated HTML
+    def indent_content(self, content: str) -> str:
+        if not self.prettyhtml:
+            return content
+        content = content.replace("\n", "\n    ")
+        content = content.strip()
+        return "    " + content
 
     def gen_link(self, target_subpath, label, a_class=None):
         class_attr = ""
@@ -423,13 +602,12 @@ class BaseGenerator:
             anchor = prepare_page_id(target_subpath)
             return f"""<a href="{anchor}"{class_attr}>{label}</a>"""
 
-        from_dir_path = os.path.dirname(self.out_path)
-
-        target_path = os.path.join(from_dir_path, target_subpath)
-        target_path = os.path.realpath(target_path)
+        from_dir_path = self.out_dir
 
         if not self.singlepagemode:
-            rel_target = os.path.relpath(target_path, from_dir_path)
+            target_path = os.path.join(from_dir_path, target_subpath)
+            target_path = cached_realpath(target_path)
+            rel_target = cached_relpath(target_path, from_dir_path)
             return f"""<a href="{rel_target}"{class_attr}>{label}</a>"""
 
         ## single page mode
@@ -449,13 +627,10 @@ class BaseGenerator:
         # return f"""<label for="{page_id}"><a href="#{page_id}_top_pos"{class_attr}>{label}</a></label>"""
 
     def create_page_id(self, page_path):
-        target_subpath = os.path.realpath(page_path)
-        rel_target = os.path.relpath(target_subpath, self.out_root_dir)
-        return prepare_page_id(rel_target)
+        return calculate_page_id(page_path, self.out_root_dir)
 
     def wrap_content(self, content, page_title, embed_images_list) -> str:
-        out_dir = os.path.dirname(self.out_path)
-        css_content = self.prepare_css(out_dir)
+        css_content = self.prepare_css(self.out_dir)
         images_content = self.prepare_images_css(embed_images_list)
 
         body_onload = ""
@@ -507,33 +682,24 @@ function change_page_to(page_id) {
 {content}
 </div>"""
 
-        return f"""\
-<!DOCTYPE html>
-<html>
-{HTML_LICENSE}
-
-<head>
-    <title>{page_title}</title>
-    <meta http-equiv="Content-Type" content="text/html; charset=utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0" />    <!-- for mobile web browser to fix font sizes -->
-    {css_content}
-    {images_content}
-</head>
-<body{body_onload}>
-{content}
-</body>
-</html>
-"""
+        return PAGE_TEMPLATE.format(
+            title=page_title,
+            css=css_content,
+            images=images_content,
+            body_onload=body_onload,
+            content=content,
+        )
 
     def store_content(self, content):
         page_path = self.out_path
         self.page_counter += 1
-        progress = self.page_counter / self.total_count * 100
-        # progress = int(self.page_counter / self.total_count * 10000) / 100
-        _LOGGER.debug("%.2f%% storing page: %s", progress, page_path)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            progress = self.page_counter / self.total_count * 100
+            # progress = int(self.page_counter / self.total_count * 10000) / 100
+            _LOGGER.debug("%.2f%% storing page: %s", progress, page_path)
 
         if not self.singlepagemode:
-            write_data(page_path, content)
+            write_data_if_changed(page_path, content)
             return
 
         ## single page mode
@@ -541,25 +707,27 @@ function change_page_to(page_id) {
         if page_path == self.out_index_path:
             checked_attr = """ checked="checked" """
 
-        content = content.replace("\n", "\n    ")
-        content = content.strip()
-        content = "    " + content
+        content = self.indent_content(content)
 
         if self.allowjs:
-            self._content += f"""
+            self._content_parts.append(
+                f"""
 <div id="{self.page_id}" class="page-container">
 {content}
 </div>
-"""
+""",
+            )
         else:
-            self._content += f"""
+            self._content_parts.append(
+                f"""
 <div id="{self.page_id}" class="page-container">\
 <input class="page-selector" type="radio" name="page-input" id="input-{self.page_id}"{checked_attr}>
 <div class="page-selector-content">
 {content}
 </div>
 </div>
-"""
+""",
+            )
 
 
 ## ===========================================================================================
@@ -618,49 +786,103 @@ class PageIndexGenerator:
 ## ===========================================================================================
 
 
+## 'width' and 'height' attributes of graph SVG
+SVG_SIZE_REGEX = re.compile(r'<svg\s+width="\d+\S+"\s+height="\d+\S+"')
+
+## link targets in graph SVG
+SVG_LINK_REGEX = re.compile(r'<a xlink:href="([\S ]+)" xlink:title="[\S ]+">')
+
+
+## model item (characteristic) page content
+MODEL_ITEM_TEMPLATE = """
+<div class="main_section title">{title}</div>
+
+{back_to}
+{content}"""
+
+## model leaf (species) page content
+MODEL_LEAF_TEMPLATE = """
+<div class="main_section title">{title}</div>
+
+{back_to}
+{graph}
+<div class="title_row main_section">{species_name}</div>
+{info}{characteristics}"""
+
+
 class PageModelGenerator:
 
     def __init__(self, base_generator: BaseGenerator):  # noqa: F811
         self.base_gen: BaseGenerator = base_generator
 
+        ## key: add_href flag
+        ## value: graph SVG without active item
+        self._graph_svg_cache: dict[bool, str] = {}
+
     def generate(self):
         model = self.base_gen.data_loader.model_data
         model_data: dict[str, Any] = model.get("data", {})
 
-        ## prepare characteristic pages
-        for item_id in model_data:
-            self._generate_item(item_id)
-
-        ## prepare species pages
+        ## characteristic pages
+        item_list = list(model_data)
+        item_paths = [self._get_item_path(item_id) for item_id in item_list]
+        ## species pages
         all_species = self.base_gen.data_loader.get_all_leafs()
-        for item_id in all_species:
-            self._generate_leaf(item_id)
-
-    def _generate_item(self, item_id):
-        page_path = os.path.join(self.base_gen.out_page_dir, f"{item_id}.html")
+        species_paths = [self._get_leaf_path(item_id) for item_id in all_species]
+
+        if self.base_gen.jobs > 1 and len(item_list) + len(all_species) > 1:
+            self._prepare_shared_caches()
+            with ProcessPoolExecutor(
+                max_workers=self.base_gen.jobs,
+                initializer=init_page_worker,
+                initargs=(self,),
+            ) as executor:
+                ## both maps are scheduled before storing results, so workers are not idle
+                items_contents = executor.map(prepare_item_page_worker, item_list, chunksize=8)
+                species_contents = executor.map(prepare_leaf_page_worker, all_species, chunksize=8)
+                self._store_pages(item_paths, items_contents)
+                self._store_pages(species_paths, species_contents)
+        else:
+            self._store_pages(item_paths, map(self.prepare_item_page, item_list))
+            self._store_pages(species_paths, map(self.prepare_leaf_page, all_species))
+
+    ## fill caches used by all pages, so workers get them instead of preparing the same data again
+    def _prepare_shared_caches(self):
+        self._get_base_graph_svg(self._graph_add_href())
+        if self.base_gen.embedimages and not self.base_gen.singlepagemode:
+            ## images embedded in model pages are subset of images of all keywords
+            self.base_gen.prepare_images_css(self.base_gen.get_all_keywords_images())
+
+    def _store_pages(self, paths_list, contents_list):
+        for page_path, content in zip(paths_list, contents_list, strict=True):
+            self.base_gen.set_out_path(page_path)
+            self.base_gen.store_content(content)
+
+    def _get_item_path(self, item_id):
+        return os.path.join(self.base_gen.out_page_dir, f"{item_id}.html")
+
+    def _get_leaf_path(self, item_id):
+        species_id_low = prepare_filename(item_id)
+        return os.path.join(self.base_gen.out_page_dir, f"{species_id_low}.html")
+
+    def prepare_item_page(self, item_id) -> str:
+        page_path = self._get_item_path(item_id)
         self.base_gen.set_out_path(page_path)
 
         page_content, keywords_list = self._prepare_model_subpage_content(item_id)
 
         page_title = self.base_gen.data_loader.get_model_title()
 
-        ## model item template
-        content = f"""
-<div class="main_section title">{page_title}</div>
-
-"""
-
         ## generate content
         prev_content = self.base_gen.prepare_back_to(item_id)
-        content += prev_content + "\n"
-        content += page_content
+        content = MODEL_ITEM_TEMPLATE.format(title=page_title, back_to=prev_content, content=page_content)
 
         if not self.base_gen.singlepagemode:
             page_title = f"{page_title} - characteristics"
             images_list = self.base_gen.get_image_paths_from_defs(keywords_list)
             content = self.base_gen.wrap_content(content, page_title, images_list)
 
-        self.base_gen.store_content(content)
+        return content
 
     def _prepare_model_subpage_content(self, model_item_id) -> tuple[str, list[DefItem]]:
         model = self.base_gen.data_loader.model_data
@@ -668,80 +890,79 @@ class PageModelGenerator:
         desc_list = model_data[model_item_id]
         columns_num = len(desc_list)
 
-        content = ""
+        content_parts = []
 
         graph_content = self._prepare_tree_graph(model_item_id)
-        content += graph_content
+        content_parts.append(graph_content)
 
-        content += """\n<div class="characteristic_section">\n"""
-        table_content = """<table>\n"""
+        content_parts.append("""\n<div class="characteristic_section">\n""")
+        table_parts = ["""<table>\n"""]
 
         ## title row
-        table_content += (
-            f"""<tr class="title_row"> <th colspan="{columns_num}">Characteristic {model_item_id}:</th> </tr>\n"""
+        table_parts.append(
+            f"""<tr class="title_row"> <th colspan="{columns_num}">Characteristic {model_item_id}:</th> </tr>\n""",
         )
 
         ## description row
-        model_texts = self.base_gen.prepare_model_item_descr()
-        prepare_desc_list = model_texts[model_item_id]
+        prepare_desc_list = self.base_gen.prepare_item_descr(model_item_id)
         char_keywords = set()
-        table_content += "<tr>"
+        table_parts.append("<tr>")
         for prep_data in prepare_desc_list:
             _value, desc, desc_keys = prep_data
             char_keywords.update(desc_keys)
-            table_content += f"""\n   <td>{desc}</td>"""
-        table_content += "\n</tr>\n"
+            table_parts.append(f"""\n   <td>{desc}</td>""")
+        table_parts.append("\n</tr>\n")
         keywords_list: list[DefItem] = list(char_keywords)
 
         ## "next" row
-        table_content += """<tr class="navigation_row"> """
+        table_parts.append("""<tr class="navigation_row"> """)
         for val in desc_list:
             next_id = val.get("next")
             if next_id:
                 next_data = self.base_gen.gen_link(f"{next_id}.html", f"next: {next_id}", "next_char")
-                table_content += f"""<td>{next_data}</td> """
+                table_parts.append(f"""<td>{next_data}</td> """)
             else:
                 target = val.get("target")
                 if target:
                     target_label = target[0]
                     item_low = prepare_filename(target_label)
                     next_data = self.base_gen.gen_link(f"{item_low}.html", target_label, "next_char")
-                    table_content += f"""<td>{next_data}</td> """
+                    table_parts.append(f"""<td>{next_data}</td> """)
                 else:
-                    table_content += """<td>--- unknown ---</td> """
-        table_content += "</tr>\n"
+                    table_parts.append("""<td>--- unknown ---</td> """)
+        table_parts.append("</tr>\n")
 
         ## potential species row
         potential_content = self._prepare_potential_species(desc_list)
         if potential_content:
-            table_content += potential_content
+            table_parts.append(potential_content)
 
-        table_content += """</table>\n"""
-        table_content = table_content.replace("\n", "\n    ")
-        table_content = table_content.strip()
-        table_content = "    " + table_content
-        content += table_content
-        content += """\n</div>\n"""
+        table_parts.append("""</table>\n""")
+        table_content = "".join(table_parts)
+        table_content = self.base_gen.indent_content(table_content)
+        content_parts.append(table_content)
+        content_parts.append("""\n</div>\n""")
 
         ## keywords row
         if keywords_list:
             keywords_list = self.base_gen.get_related_keywords(keywords_list)
-            content += """\n<div class="keywords_section">\n"""
-            content += self.base_gen.prepare_defs_table(keywords_list)
-            content += """\n</div>\n"""
+            content_parts.append("""\n<div class="keywords_section">\n""")
+            content_parts.append(self.base_gen.prepare_defs_table(keywords_list))
+            content_parts.append("""\n</div>\n""")
 
-        return content, keywords_list
+        return "".join(content_parts), keywords_list
 
     def _prepare_potential_species(self, desc_list):
         columns_num = len(desc_list)
 
-        potential_content = ""
-        potential_content += f"""<tr class="title_row"> <td colspan="{columns_num}">Potential species:</td> </tr>\n"""
-        potential_content += """<tr class="species_row">"""
+        parts = [
+            f"""<tr class="title_row"> <td colspan="{columns_num}">Potential species:</td> </tr>\n""",
+            """<tr class="species_row">""",
+        ]
         potential_species_dict = self.base_gen.data_loader.potential_species
         found_potential = False
         for val in desc_list:
-            next_species = []
+            next_species: Sequence[str] = ()
             next_id = val.get("next")
             if next_id:
                 next_species = potential_species_dict.get(next_id)
@@ -751,54 +972,49 @@ class PageModelGenerator:
             #         next_species.append( target[0] )
             if next_species:
                 found_potential = True
-                next_species.sort()
-                list_content = ["<ul>\n"]
+                parts.append("""\n    <td><ul>\n""")
                 for item in next_species:
                     item_low = prepare_filename(item)
                     a_href = self.base_gen.gen_link(f"{item_low}.html", item)
-                    list_content.append(f"        <li>{a_href}</li>\n")
-                list_content.append("        </ul>")
-                list_str = "".join(list_content)
-                potential_content += f"""\n    <td>{list_str}\n    </td>"""
+                    parts.append(f"        <li>{a_href}</li>\n")
+                parts.append("""        </ul>\n    </td>""")
                 continue
 
             ## no species found
-            potential_content += """<td></td> """
-        potential_content += "\n</tr>\n"
+            parts.append("""<td></td> """)
+        parts.append("\n</tr>\n")
 
         if found_potential:
-            return potential_content
+            return "".join(parts)
         return None
 
-    def _generate_leaf(self, model_item_id):
-        species_id_low = prepare_filename(model_item_id)
-        page_path = os.path.join(self.base_gen.out_page_dir, f"{species_id_low}.html")
+    def prepare_leaf_page(self, model_item_id) -> str:
+        page_path = self._get_leaf_path(model_item_id)
         self.base_gen.set_out_path(page_path)
 
         prev_list = self.base_gen.data_loader.nav_dict.prev_items_list(model_item_id)
 
         ## characteristics list
-        model_texts = self.base_gen.prepare_model_item_descr()
         char_keywords = set()
-        characteristic_content = """<ul class="characteristic_list">\n"""
+        characteristic_parts = ["""<ul class="characteristic_list">\n"""]
         for prev_item in prev_list:
             prev_id = prev_item[0]
             prev_desc_index = prev_item[1]
-            prev_data = model_texts[prev_id]
+            prev_data = self.base_gen.prepare_item_descr(prev_id)
             prev_desc_item = prev_data[prev_desc_index]
             _prev_desc, desc, desc_keys = prev_desc_item
             char_keywords.update(desc_keys)
             char_link = self.base_gen.gen_link(f"{prev_id}.html", prev_id)
-            characteristic_content += f"""<li>{char_link}: {desc}</li>\n"""
-        characteristic_content += "</ul>\n"
+            characteristic_parts.append(f"""<li>{char_link}: {desc}</li>\n""")
+        characteristic_parts.append("</ul>\n")
         keywords_list: list[DefItem] = list(char_keywords)
 
         ## keywords row
         if keywords_list:
             keywords_list = self.base_gen.get_related_keywords(keywords_list)
-            characteristic_content += """\n<div class="keywords_section">\n"""
-            characteristic_content += self.base_gen.prepare_defs_table(keywords_list)
-            characteristic_content += """\n</div>\n"""
+            characteristic_parts.append("""\n<div class="keywords_section">\n""")
+            characteristic_parts.append(self.base_gen.prepare_defs_table(keywords_list))
+            characteristic_parts.append("""\n</div>\n""")
 
         last_item = prev_list[-1]
         species_target = self.base_gen.data_loader.get_target(*last_item)
@@ -806,47 +1022,37 @@ class PageModelGenerator:
 
         page_title = self.base_gen.data_loader.get_model_title()
 
-        ## model leaf template
-        content = f"""
-<div class="main_section title">{page_title}</div>
-
-"""
-
         ## generate content
         prev_content = self.base_gen.prepare_back_to(model_item_id)
-        content += prev_content + "\n"
-
         graph_content = self._prepare_tree_graph(model_item_id)
-        content += graph_content
 
-        content += f"""\n<div class="title_row main_section">{species_name}</div>\n"""
+        info_content = ""
         info_url = species_target[1]
         if info_url:
-            content += f"""<div>Info: <a href="{info_url}">{info_url}</a></div>\n"""
+            info_content = f"""<div>Info: <a href="{info_url}">{info_url}</a></div>\n"""
             # a_link = self.base_gen.gen_link(info_url, info_url)
-            # content += f"""<div>Info: {a_link}</div>\n"""
-
-        content += characteristic_content
+            # info_content = f"""<div>Info: {a_link}</div>\n"""
+
+        content = MODEL_LEAF_TEMPLATE.format(
+            title=page_title,
+            back_to=prev_content,
+            graph=graph_content,
+            species_name=species_name,
+            info=info_content,
+            characteristics="".join(characteristic_parts),
+        )
 
         if not self.base_gen.singlepagemode:
             page_title = f"{page_title} - {species_name}"
             images_list = self.base_gen.get_image_paths_from_defs(keywords_list)
             content = self.base_gen.wrap_content(content, page_title, images_list)
 
-        self.base_gen.store_content(content)
+        return content
 
     def _prepare_tree_graph(self, active_item_id):
-        add_href = True
-        if self.base_gen.singlepagemode and not self.base_gen.allowjs:
-            add_href = False
-        data_graph = generate_graph(self.base_gen.data_loader, active_item_id, add_href=add_href)
-        svg_content = get_graph_svg(data_graph)
-
-        ## remove defined 'width' and 'height' - attributes corrupts image placement
-        svg_content = re.sub(r'<svg\s+width="\d+\S+"\s+height="\d+\S+"', "<svg", svg_content)
-        svg_content = svg_content.replace("\n", "\n    ")
-        svg_content = svg_content.strip()
-        svg_content = "    " + svg_content
+        add_href = self._graph_add_href()
+        svg_content = self._prepare_graph_svg(active_item_id, add_href)
+        svg_content = self.base_gen.indent_content(svg_content)
 
         if self.base_gen.singlepagemode:
             ## make unique items
@@ -854,14 +1060,13 @@ class PageModelGenerator:
 
             if self.base_gen.allowjs:
                 ## change links
-                found = re.findall(r'<a xlink:href="([\S ]+)" xlink:title="[\S ]+">', svg_content)
+                found = SVG_LINK_REGEX.findall(svg_content)
                 for target in found:
                     target_path = os.path.join(self.base_gen.out_page_dir, target)
                     target_id = self.base_gen.create_page_id(target_path)
-                    svg_content = re.sub(
-                        rf'xlink:href="{target}"',
+                    svg_content = svg_content.replace(
+                        f'xlink:href="{target}"',
                         f'xlink:href="#" onclick="change_page_to(\'{target_id}\');"',
-                        svg_content,
                     )
             #     ## remove links
             #     svg_content = re.sub(r'<a xlink:href="[\S ]+" xlink:title="[\S ]+">', "", svg_content)
@@ -873,6 +1078,52 @@ class PageModelGenerator:
 </div>
 """
 
+    def _graph_add_href(self):
+        return not self.base_gen.singlepagemode or self.base_gen.allowjs
+
+    def _prepare_graph_svg(self, active_item_id, add_href):
+        base_svg = self._get_base_graph_svg(add_href)
+        svg_content = mark_svg_active_node(base_svg, active_item_id)
+        if svg_content is None:
+            ## node not found in SVG - render graph for active item
+            svg_content = self._render_graph_svg(active_item_id, add_href)
+        return svg_content
+
+    ## layout of graph does not depend on active item - render graph once and only mark active node
+    def _get_base_graph_svg(self, add_href):
+        base_svg = self._graph_svg_cache.get(add_href)
+        if base_svg is None:
+            base_svg = self._render_graph_svg(None, add_href)
+            self._graph_svg_cache[add_href] = base_svg
+        return base_svg
+
+    def _render_graph_svg(self, active_item_id, add_href):
+        data_graph = generate_graph(self.base_gen.data_loader, active_item_id, add_href=add_href)
+        svg_content = get_graph_svg(data_graph)
+        ## remove defined 'width' and 'height' - attributes corrupts image placement
+        return SVG_SIZE_REGEX.sub("<svg", svg_content)
+
+
+## generator instance of page worker process
+_WORKER_PAGE_GENERATOR: PageModelGenerator = None
+
+
+def init_page_worker(page_generator: PageModelGenerator):
+    # pylint: disable=W0603
+    # ruff: noqa: PLW0603
+    global _WORKER_PAGE_GENERATOR
+    _WORKER_PAGE_GENERATOR = page_generator
+    ## pages are already prepared in parallel by processes - avoid jobs x CPUs threads
+    page_generator.base_gen.image_threads = 1
+
+
+def prepare_item_page_worker(item_id) -> str:
+    return _WORKER_PAGE_GENERATOR.prepare_item_page(item_id)
+
+
+def prepare_leaf_page_worker(item_id) -> str:
+    return _WORKER_PAGE_GENERATOR.prepare_leaf_page(item_id)
+
 
 ## ===========================================================================================
 
@@ -889,32 +1140,31 @@ class PageSpeciesIndexGenerator:
         page_title = self.base_gen.data_loader.get_model_title()
 
         ## species index template
-        content = f"""
+        content_parts = [
+            f"""
 <div class="main_section title">{page_title}</div>
 
-"""
+""",
+        ]
 
         ## generate content
         prev_content = self.base_gen.prepare_back_to()
-        content += prev_content + "\n"
+        content_parts.append(prev_content + "\n")
 
-        content += """\n<div class="main_section">List of species included in the key:</div>\n"""
+        content_parts.append("""\n<div class="main_section">List of species included in the key:</div>\n""")
 
-        species_set = set()
-        potential_species_dict = self.base_gen.data_loader.potential_species
-        for char_species_list in potential_species_dict.values():
-            species_set.update(char_species_list)
-        species_list = list(species_set)
-        species_list.sort()
-
-        list_content = ["""\n<ul class="species_list">\n"""]
-        for species in species_list:
-            item_low = prepare_filename(species)
-            a_href = self.base_gen.gen_link(f"page/{item_low}.html", species)
-            list_content.append(f"    <li>{a_href}</li>\n")
-        list_content.append("</ul>\n")
-        list_str = "".join(list_content)
-        content += list_str
+        species_list = self.base_gen.data_loader.get_all_species()
+
+        content_parts.append("""\n<ul class="species_list">\n""")
+        gen_link = self.base_gen.gen_link
+        content_parts.extend(
+            [
+                f"    <li>{gen_link(f'page/{prepare_filename(species)}.html', species)}</li>\n"
+                for species in species_list
+            ],
+        )
+        content_parts.append("</ul>\n")
+        content = "".join(content_parts)
 
         if not self.base_gen.singlepagemode:
             page_title = f"{page_title} - species"
@@ -939,17 +1189,19 @@ class PageDictionaryGenerator:
         page_title = self.base_gen.data_loader.get_model_title()
 
         ## dictionary template
-        content = f"""
+        content_parts = [
+            f"""
 <div class="main_section title">{page_title}</div>
 
-"""
+""",
+        ]
 
         ## generate content
         prev_content = self.base_gen.prepare_back_to()
-        content += prev_content + "\n"
+        content_parts.append(prev_content + "\n")
 
-        content += (
-            """\n<div class="main_section">Explanation of some definitions used in the characteristics.</div>\n"""
+        content_parts.append(
+            """\n<div class="main_section">Explanation of some definitions used in the characteristics.</div>\n""",
         )
 
         ## copy images
@@ -968,13 +1220,14 @@ class PageDictionaryGenerator:
 
         keywords_content = self.base_gen.prepare_defs_table(keywords_list)
         if keywords_content:
-            content += """\n<div class="keywords_section">\n"""
-            content += keywords_content
-            content += """\n</div>\n"""
+            content_parts.append("""\n<div class="keywords_section">\n""")
+            content_parts.append(keywords_content)
+            content_parts.append("""\n</div>\n""")
+        content = "".join(content_parts)
 
         if not self.base_gen.singlepagemode:
             page_title = f"{page_title} - dictionary"
-            images_list = self.base_gen.get_image_paths_from_defs(keywords_list)
+            images_list = self.base_gen.get_all_keywords_images()
             content = self.base_gen.wrap_content(content, page_title, images_list)
 
         self.base_gen.store_content(content)
@@ -989,7 +1242,7 @@ class StaticGenerator:
         self.base_gen: BaseGenerator = None
 
     # ruff: noqa: PLR0913
-    def generate(
+    def generate(  # pylint: disable=R0913
         self,
         data_loader: DataLoader,
         output_dir_path,
@@ -999,12 +1252,17 @@ class StaticGenerator:
         embedimages=False,
         singlepagemode=False,
         allowjs=False,
+        jobs=1,
+        prettyhtml=False,
     ):
         self.base_gen = BaseGenerator()
         self.base_gen.embedcss = embedcss
         self.base_gen.embedimages = embedimages
         self.base_gen.singlepagemode = singlepagemode
         self.base_gen.allowjs = allowjs
+        self.base_gen.prettyhtml = prettyhtml
+        ## worker processes pay off only for large models on multi-core hosts, so they are opt-in
+        self.base_gen.jobs = jobs
 
         self.base_gen.set_root_dir(output_dir_path)
 
@@ -1030,7 +1288,8 @@ class StaticGenerator:
 
         if not self.base_gen.embedcss:
             css_styles_path = os.path.join(DATA_DIR, "styles.css")
-            shutil.copy(css_styles_path, self.base_gen.out_root_dir, follow_symlinks=True)
+            css_dest_path = os.path.join(self.base_gen.out_root_dir, "styles.css")
+            copy_file_if_changed(css_styles_path, css_dest_path)
 
         if self.base_gen.singlepagemode:
             self._store_singlepage()
@@ -1038,20 +1297,37 @@ class StaticGenerator:
     def _store_singlepage(self):
         page_title = self.base_gen.data_loader.get_model_title()
 
-        content = self.base_gen.get_content()
+        content = self.base_gen.pop_content()
 
         ## single page template
         self.base_gen.set_out_path(self.base_gen.out_index_path)
-        keywords_list = self.base_gen.get_all_keywords()
-        images_list = self.base_gen.get_image_paths_from_defs(keywords_list)
+        images_list = self.base_gen.get_all_keywords_images()
         content = self.base_gen.wrap_content(content, page_title, images_list)
 
-        write_data(self.base_gen.out_index_path, content)
+        write_data_if_changed(self.base_gen.out_index_path, content)
 
 
 ## ===========================================================================================
 
 
+def encode_base64(data: bytes) -> str:
+    if pybase64 is not None:
+        return pybase64.b64encode(data).decode("utf-8")
+    return base64.b64encode(data).decode("utf-8")
+
+
+## the same pairs of paths are resolved for many pages
+@functools.lru_cache(maxsize=4096)
+def cached_relpath(path, start):
+    return os.path.relpath(path, start)
+
+
+## output directories do not change during generation, so resolved paths can be reused
+@functools.lru_cache(maxsize=4096)
+def cached_realpath(path):
+    return os.path.realpath(path)
+
+
 def get_path_components(path, level):
     remaining = path
     ret = None
@@ -1065,134 +1341,228 @@ def get_path_components(path, level):
 
 
 def find_all_defs(content, def_list: list[DefItem]) -> list[tuple[int, DefItem]]:
-    palces_list = []
-    for def_item in def_list:
-        def_key = def_item.defvalue
-        def_match = def_item.casesensitive
+    defs_patterns = prepare_defs_patterns(def_list)
+    return list(iter_defs_matches(content, defs_patterns))
+
+
+## returns list of triplets (case sensitive, matcher, definitions dict) - one for each case mode
+## matcher: Aho-Corasick automaton if 'pyahocorasick' is available, otherwise regex pattern
+## definitions dict: key: definition value
+##                   value: pair (index in def_list, definition item) - first item takes precedence
+def prepare_defs_patterns(def_list: list[DefItem]) -> list[tuple[bool, Any, dict[str, tuple[int, DefItem]]]]:
+    mode_defs: dict[bool, dict[str, tuple[int, DefItem]]] = {True: {}, False: {}}
+    for def_index, def_item in enumerate(def_list):
+        case_sensitive = def_item.casesensitive is not False
+        mode_defs[case_sensitive].setdefault(def_item.defvalue, (def_index, def_item))
+
+    ret_list = []
+    for case_sensitive, defs_dict in mode_defs.items():
+        if defs_dict:
+            if ahocorasick is None:
+                matcher = compile_find_pattern(tuple(defs_dict))
+            else:
+                matcher = build_find_automaton(tuple(defs_dict))
+            ret_list.append((case_sensitive, matcher, defs_dict))
+    return ret_list
+
+
+## yields non-overlapping pairs (position, definition item) in ascending order
+def iter_defs_matches(content, defs_patterns):
+    def iter_places(case_sensitive, matcher, defs_dict):
         item_content = content
-        if def_match is False:
+        if case_sensitive is False:
             item_content = content.lower()
-        places = find_all(item_content, def_key)
-        if not places:
-            continue
-        palces_list.extend([(pos, def_item) for pos in places])
+        for pos, def_value in iter_words_matches(item_content, matcher):
+            def_index, def_item = defs_dict[def_value]
+            yield (pos, -len(def_value), def_index, def_item)
+
+    ## scan content once per case mode for all definitions
+    ## each scan yields places in ascending order, so they only need to be merged
+    places_streams = [iter_places(*mode_data) for mode_data in defs_patterns]
 
-    ret_list = []
     recent_end = -1
-    palces_list = sorted(palces_list, key=lambda x: (x[0], -len(x[1].defvalue)))
-    for pos_item in palces_list:
-        pos = pos_item[0]
+    for pos, _def_len, _def_index, def_item in heapq.merge(*places_streams):
         if pos <= recent_end:
             continue
-        ret_list.append(pos_item)
-        pos_end = pos + len(pos_item[1].defvalue)
-        recent_end = pos_end
+        yield (pos, def_item)
+        recent_end = pos + len(def_item.defvalue)
+
+
+## yields pairs (position, longest whole word matched at position) in ascending order
+def iter_words_matches(content, matcher):
+    if isinstance(matcher, re.Pattern):
+        for found in matcher.finditer(content):
+            yield (found.start(), found.group(1))
+        return
+
+    ## automaton reports all matches ordered by end position
+    longest_words: dict[int, str] = {}
+    content_len = len(content)
+    for end_pos, word in matcher.iter(content):
+        pos = end_pos - len(word) + 1
+        if pos > 0 and is_word_letter(content[pos - 1]):
+            continue
+        if end_pos + 1 < content_len and is_word_letter(content[end_pos + 1]):
+            continue
+        if len(word) > len(longest_words.get(pos, "")):
+            longest_words[pos] = word
+    for pos in sorted(longest_words):
+        yield (pos, longest_words[pos])
 
-    return ret_list
 
+## the same class of characters as regex '[^\W\d_]' used by compile_find_pattern()
+def is_word_letter(char: str) -> bool:
+    return char.isalnum() and not char.isdecimal()
 
-def find_all(content, substring, *, match_subword=False) -> list[int]:
-    ret_list = []
-    content_endpos = len(content)
-    substr_len = len(substring)
-    pos = 0
-    while True:
-        new_pos = content.find(substring, pos)
-        if new_pos < 0:
-            break
-        pos = new_pos + 1
-        if match_subword:
-            ret_list.append(new_pos)
-            continue
-        ## additional match
-        if new_pos > 0:
-            prev_char = content[new_pos - 1]
-            if prev_char.isalpha():
-                ## middle of word - skip
-                continue
-        new_after_endpos = new_pos + substr_len
-        if new_after_endpos < content_endpos:
-            next_char = content[new_after_endpos]
-            if next_char.isalpha():
-                ## middle of word - skip
-                continue
-        ret_list.append(new_pos)
-    return ret_list
 
+@functools.lru_cache(maxsize=256)
+def build_find_automaton(substrings: tuple[str, ...]):
+    automaton = ahocorasick.Automaton()
+    for item in substrings:
+        if item:
+            automaton.add_word(item, item)
+    automaton.make_automaton()
+    return automaton
 
+
+def find_all(content, substring, *, match_subword=False) -> list[int]:
+    if substring not in content:
+        ## common case - skip regex scan
+        return []
+    pattern = compile_find_pattern((substring,), match_subword=match_subword)
+    return [found.start() for found in pattern.finditer(content)]
+
+
+## returns pattern finding (possibly overlapping) positions of given substrings
+## matched substring is available as first group - longest one if many matches at the same position
+@functools.lru_cache(maxsize=256)
+def compile_find_pattern(substrings: tuple[str, ...], *, match_subword=False) -> re.Pattern:
+    ## regex alternation takes first matching alternative, so longest has to go first
+    longest_first = sorted(substrings, key=len, reverse=True)
+    alternatives = "|".join(re.escape(item) for item in longest_first)
+    if match_subword:
+        return re.compile(f"(?=({alternatives}))")
+    ## letter before or after substring means middle of word
+    return re.compile(rf"(?<![^\W\d_])(?=({alternatives})(?![^\W\d_]))")
+
+
+@functools.cache
 def prepare_image_id(img_path: str):
     image_id = prepare_page_id(img_path)
     return f"image_{image_id}"
 
 
+PAGE_ID_TRANSLATION = str.maketrans({" ": "_", ".": "_", "-": "_", "/": "_", "\\": "_"})
+
+FILENAME_TRANSLATION = str.maketrans({"(": "_", ")": "_"})
+
+WHITESPACES_REGEX = re.compile(r"\s+")
+
+
 def prepare_page_id(page_path: str):
-    page_id = page_path
-    page_id = page_id.replace(" ", "_")
-    page_id = page_id.replace(".", "_")
-    page_id = page_id.replace("-", "_")
-    page_id = page_id.replace("/", "_")
-    return page_id.replace("\\", "_")
+    return page_path.translate(PAGE_ID_TRANSLATION)
 
 
+## page id is based on path of page relative to output root directory
+@functools.lru_cache(maxsize=4096)
+def calculate_page_id(page_path: str, root_dir: str):
+    target_subpath = os.path.realpath(page_path)
+    rel_target = os.path.relpath(target_subpath, root_dir)
+    return prepare_page_id(rel_target)
+
+
+@functools.cache
 def prepare_filename(name: str):
     name = name.lower()
-    name = re.sub(r"\s+", "_", name)
+    name = WHITESPACES_REGEX.sub("_", name)
     # name = name.replace(".", "_")
-    name = name.replace("(", "_")
-    return name.replace(")", "_")
+    return name.translate(FILENAME_TRANSLATION)
 
 
 ## ================================================================
 
 
-def generate_graph(data_loader: DataLoader, active_item: str, *, add_href=True) -> Graph:
-    graph: Graph = Graph()
-    base_graph = graph.base_graph
-    base_graph.set_name("model_graph")
-    base_graph.set_type("digraph")
-    # base_graph.set_rankdir("LR")
+## DOT attributes of graph elements
+GRAPH_ACTIVE_NODE_FILL = "yellow"
+GRAPH_NODE_FILL = "white"
+GRAPH_ACTIVE_NODE_ATTRS = f"shape=ellipse, style=filled, fillcolor={GRAPH_ACTIVE_NODE_FILL}"
+GRAPH_NODE_ATTRS = f"shape=ellipse, style=filled, fillcolor={GRAPH_NODE_FILL}"
+GRAPH_EDGE_ATTRS = "color=black"
+
 
+## returns graph in DOT format
+def generate_graph(data_loader: DataLoader, active_item: str, *, add_href=True) -> str:
     model_data = data_loader.model_data["data"]
 
+    dot_lines = ["digraph model_graph {"]
     added_nodes: set[str] = set()
 
+    def add_node(node):
+        if node in added_nodes:
+            return
+        added_nodes.add(node)
+        node_attrs = GRAPH_ACTIVE_NODE_ATTRS if node == active_item else GRAPH_NODE_ATTRS
+        if add_href:
+            node_filename = prepare_filename(node)
+            node_attrs += f", href={quote_dot_id(node_filename + '.html')}"
+        dot_lines.append(f"{quote_dot_id(node)} [{node_attrs}];")
+
+    def add_edge(from_node, to_node):
+        add_node(from_node)
+        add_node(to_node)
+        dot_lines.append(f"{quote_dot_id(from_node)} -> {quote_dot_id(to_node)} [{GRAPH_EDGE_ATTRS}];")
+
     ## add edges
     for key, val_list in model_data.items():
         for val in val_list:
-            edges = []
             next_id = val["next"]
             if next_id is not None:
-                edges.append((key, next_id))
+                add_edge(key, next_id)
             target = val["target"]
             if target is not None:
-                edges.append((key, target[0]))
+                add_edge(key, target[0])
 
-            for new_edge in edges:
-                for node in new_edge:
-                    if node in added_nodes:
-                        continue
-                    if node == active_item:
-                        graph.addNode(node, shape="ellipse")
-                        active_node = graph.getNode(node)
-                        style = {"style": "filled", "fillcolor": "yellow"}
-                        set_node_style(active_node, style)
-                    else:
-                        graph.addNode(node, shape="ellipse")
-                        active_node = graph.getNode(node)
-                        style = {"style": "filled", "fillcolor": "white"}
-                        set_node_style(active_node, style)
-                    created_node = graph.getNode(node)
-                    node_filename = prepare_filename(node)
-                    if add_href:
-                        created_node.set("href", f"{node_filename}.html")
-
-                added_edge = graph.addEdge(*new_edge)
-                added_edge.set("color", "black")
-    return graph
-
-
-def get_graph_svg(graph: Graph):
-    with io.BytesIO() as buffer:
-        graph.write(buffer, file_format="svg")
-        contents = buffer.getvalue()
-        return contents.decode("utf-8")
+    dot_lines.append("}")
+    dot_lines.append("")
+    return "\n".join(dot_lines)
+
+
+def quote_dot_id(value: str) -> str:
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'
+
+
+## Graphviz escapes XML special characters and hyphens in titles (see xml_escape() in Graphviz sources)
+SVG_TITLE_TRANSLATION = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;", "-": "&#45;"},
+)
+
+
+## changes fill color of given node in SVG rendered by Graphviz
+## returns None if node could not be found
+def mark_svg_active_node(svg_content: str, node: str) -> str:
+    title_tag = f"<title>{node.translate(SVG_TITLE_TRANSLATION)}</title>"
+    title_pos = svg_content.find(title_tag)
+    ## graph and edges have titles too - only title placed directly in node group is valid
+    while title_pos >= 0:
+        group_pos = svg_content.rfind("<g ", 0, title_pos)
+        if group_pos >= 0 and 'class="node"' in svg_content[group_pos:title_pos]:
+            break
+        title_pos = svg_content.find(title_tag, title_pos + len(title_tag))
+    if title_pos < 0:
+        return None
+    ## node shape is placed right after title (inside link group if present)
+    shape_end = svg_content.find("</g>", title_pos)
+    fill_pos = svg_content.find(f'fill="{GRAPH_NODE_FILL}"', title_pos, shape_end)
+    if fill_pos < 0:
+        return None
+    fill_end = fill_pos + len(f'fill="{GRAPH_NODE_FILL}"')
+    return f'{svg_content[:fill_pos]}fill="{GRAPH_ACTIVE_NODE_FILL}"{svg_content[fill_end:]}'
+
+
+def get_graph_svg(dot_source: str):
+    ## pass DOT source directly to Graphviz - no temporary files and buffers
+    # ruff: noqa: S603, S607
+    dot_command = ["dot", "-Tsvg"]
+    result = subprocess.run(dot_command, input=dot_source.encode("utf-8"), capture_output=True, check=True)  # nosec
+    return result.stdout.decode("utf-8")
@@ -30,11 +30,13 @@ def dict_to_html_table(data_dict, translation_dict=None, table_class=None, *, he
     table_css = ""
     if table_class:
         table_css = """ class='detailstable'"""
-    content = ""
-    content += f"""<table cellspacing="0"{table_css}>\n"""
+    content_parts = [f"""<table cellspacing="0"{table_css}>\n"""]
     if header:
-        content += f"""<tr> <th>{get_translation(translation_dict, "Parameter")}:</th>\
- <th>{get_translation(translation_dict, "Value")}:</th> </tr>\n"""
+        content_parts.append(
+            f"""<tr> <th>{get_translation(translation_dict, "Parameter")}:</th>\
+ <th>{get_translation(translation_dict, "Value")}:</th> </tr>\n""",
+        )
+    empty_str = None  ## translated once, when first needed
     for key, val in data_dict.items():
         val_str = ""
         if isinstance(val, list):
@@ -43,13 +45,16 @@ def dict_to_html_table(data_dict, translation_dict=None, table_class=None, *, he
         else:
             val_str = convert_href_value(val)
         if not val_str:
-            val_str = f"""<span class="empty">[{get_translation(translation_dict, "empty")}]</span>"""
-        content += f"""<tr> <td>{key}</td> <td>{val_str}</td> </tr>\n"""
-    content += """</table>"""
-    return content
+            if empty_str is None:
+                empty_str = f"""<span class="empty">[{get_translation(translation_dict, "empty")}]</span>"""
+            val_str = empty_str
+        content_parts.append(f"""<tr> <td>{key}</td> <td>{val_str}</td> </tr>\n""")
+    content_parts.append("""</table>""")
+    return "".join(content_parts)
 
 
 def convert_href_value(val):
+    val_str = str(val)
     if is_url(val):
-        return f"""<a href="{val}">{val}</a>"""
-    return str(val)
+        return f"""<a href="{val_str}">{val_str}</a>"""
+    return val_str
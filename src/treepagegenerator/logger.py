@@ -6,14 +6,18 @@
 # LICENSE file in the root directory of this source tree.
 #
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from logging import handlers
 
 
 SCRIPT_DIR = os.path.dirname(__file__)
 output_file = None
+queue_listener = None
+queue_handler = None
 
 
 def get_logging_output_file(log_dir=None):
@@ -31,7 +35,11 @@ def get_logging_output_file(log_dir=None):
 def configure(log_file=None, log_dir=None, log_level=None):
     # pylint: disable=W0603
     # ruff: noqa: PLW0603
-    global output_file
+    global output_file, queue_listener, queue_handler
+
+    ## calling again replaces previous configuration instead of duplicating log records
+    release()
+
     output_file = log_file
     if output_file is None:
         output_file = get_logging_output_file(log_dir)
@@ -49,15 +57,43 @@ def configure(log_file=None, log_dir=None, log_level=None):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    logging.root.addHandler(console_handler)
-    logging.root.addHandler(file_handler)
+    ## handlers are run by background thread, so logging calls do not block on writes
+    ## in-process queue is enough - worker processes only prepare content and do not log through it
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_listener = handlers.QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    queue_listener.start()
+
+    queue_handler = handlers.QueueHandler(log_queue)
+    logging.root.addHandler(queue_handler)
     logging.root.setLevel(log_level)
 
+    ## process info is not used in log format
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logging.getLogger("matplotlib").setLevel(logging.WARNING)
 
     logging.getLogger("urllib3").setLevel(logging.INFO)
 
 
+## remove handlers installed by configure(), pending records are written before return
+def release():
+    # pylint: disable=W0603
+    # ruff: noqa: PLW0603
+    global queue_listener, queue_handler
+    if queue_handler is not None:
+        logging.root.removeHandler(queue_handler)
+        queue_handler = None
+    if queue_listener is not None:
+        queue_listener.stop()
+        for handler in queue_listener.handlers:
+            handler.close()
+        queue_listener = None
+
+
+atexit.register(release)
+
+
 ##     loggerFormat   = '%(asctime)s,%(msecs)-3d %(levelname)-8s %(threadName)s [%(filename)s:%(lineno)d] %(message)s'
 ##     dateFormat     = '%Y-%m-%d %H:%M:%S'
 ##     logging.basicConfig( format   = loggerFormat,
@@ -105,9 +141,8 @@ class EmptyLineFormatter(logging.Formatter):
     ## override base class method
     def format(self, record):
         msg = record.getMessage()
-        clear_msg = msg.replace("\n", "")
-        clear_msg = clear_msg.replace("\r", "")
-        if not clear_msg:
+        ## single pass, usually without copying message
+        if not msg.strip("\r\n"):
             # empty
             return msg
         return super().format(record)
@@ -20,6 +20,7 @@ with contextlib.suppress(ImportError):
     ## in this case __init__ is already loaded
 
 import argparse
+import functools
 import logging
 import sys
 
@@ -42,6 +43,8 @@ def process_generate(args):
     embedimages = args.embedimages
     singlepagemode = args.singlepagemode
     allowjs = args.allowjs
+    jobs = args.jobs
+    prettyhtml = args.prettyhtml
     output_index_name = args.outindexname
     output_path = args.outdir
 
@@ -53,6 +56,8 @@ def process_generate(args):
         embedimages=embedimages,
         singlepagemode=singlepagemode,
         allowjs=allowjs,
+        jobs=jobs,
+        prettyhtml=prettyhtml,
     )
     return 0
 
@@ -69,7 +74,9 @@ def process_info(args):
 # =======================================================================
 
 
-def main():
+## parser does not change between calls, so it is created once (e.g. when 'main()' is called in loop)
+@functools.lru_cache(maxsize=1)
+def create_parser():
     parser = argparse.ArgumentParser(
         prog="python3 -m treepagegenerator.main",
         description="generate static pages containing tree search based on defined model",
@@ -107,6 +114,19 @@ def main():
         default=False,
         help="Allow JavaScript (for single page mode)",
     )
+    subparser.add_argument(
+        "--jobs",
+        action="store",
+        type=int,
+        default=1,
+        help="Number of processes generating pages",
+    )
+    subparser.add_argument(
+        "--prettyhtml",
+        action="store_true",
+        default=False,
+        help="Indent nested content of generated HTML",
+    )
     subparser.add_argument("--outindexname", action="store", default="index.html", help="Name of main index page")
     subparser.add_argument("--outdir", action="store", required=True, help="Path to output directory")
 
@@ -118,8 +138,11 @@ def main():
     subparser.set_defaults(func=process_info)
     subparser.add_argument("-d", "--data", action="store", required=False, help="Path to data file with model")
 
-    ## =================================================
+    return parser, subparsers
 
+
+def main():
+    parser, subparsers = create_parser()
     args = parser.parse_args()
 
     if args.listtools is True:
@@ -7,12 +7,15 @@
 #
 
 import datetime
+import functools
 import hashlib
 import html
 import json
 import logging
 import os
 from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
 
 import pytz
 from appdirs import user_data_dir
@@ -21,6 +24,8 @@ from appdirs import user_data_dir
 _LOGGER = logging.getLogger(__name__)
 
 
+## directory is resolved and created once per process
+@functools.lru_cache(maxsize=1)
 def get_app_datadir():
     data_dir = user_data_dir("tree-page-generator")
     os.makedirs(data_dir, exist_ok=True)
@@ -34,9 +39,15 @@ def get_recentdate_path():
 
 def get_recent_date():
     today_date = datetime.date.today()
-    midnight = datetime.datetime.combine(today_date, datetime.time())
+    return get_recent_date_for(today_date)
+
+
+## result changes only once a day
+@functools.lru_cache(maxsize=1)
+def get_recent_date_for(today_date: datetime.date):
     # move back 1 day to prevent short time window where data could be skipped
-    midnight = midnight - datetime.timedelta(days=1)
+    recent_date = today_date - datetime.timedelta(days=1)
+    midnight = datetime.datetime.combine(recent_date, datetime.time())
     return add_timezone(midnight)
 
 
@@ -53,49 +64,74 @@ def string_to_date_general(date_string) -> datetime.datetime:
         raise
 
 
+## the same dates repeat in data, parsed datetimes are immutable so results of parsers below can be shared
+
+
 # iso format: '2024-06-04T14:23:41Z'
+@functools.lru_cache(maxsize=4096)
 def string_iso_to_date(datetime_string) -> datetime.datetime:
     item_date = datetime.datetime.fromisoformat(datetime_string)
+    if item_date.tzinfo is not None:
+        ## string contains time zone
+        return item_date
     return add_timezone(item_date)
 
 
-# handled format: 2024-06-04T14:23:41.077Z
+# handled format: 2024-06-04T14:23:41Z
+@functools.lru_cache(maxsize=4096)
 def string_iso2_to_date(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%SZ")
-    return add_timezone(item_date)
+    item_date = zulu_string_to_date(datetime_string, fraction=False)
+    return item_date.replace(tzinfo=datetime.UTC)
 
 
 # handled format: 2024-06-04T14:23:41.077Z
+@functools.lru_cache(maxsize=4096)
 def string_isoz_to_date(datetime_string) -> datetime.datetime:
-    item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%dT%H:%M:%S.%fZ")
-    return add_timezone(item_date)
+    item_date = zulu_string_to_date(datetime_string, fraction=True)
+    return item_date.replace(tzinfo=datetime.UTC)
+
 
+## parse string ending with 'Z' (UTC designator) into naive datetime
+## 'fromisoformat()' is implemented in C and is much faster than 'strptime()'
+def zulu_string_to_date(datetime_string, *, fraction) -> datetime.datetime:
+    valid_format = datetime_string.endswith("Z") and datetime_string[10:11] == "T"
+    valid_format = valid_format and ("." in datetime_string) is fraction
+    if valid_format:
+        item_date = datetime.datetime.fromisoformat(datetime_string[:-1])
+        if item_date.tzinfo is None:
+            return item_date
+    message = f"time data '{datetime_string}' does not match format"
+    raise ValueError(message)
 
+
+@functools.lru_cache(maxsize=4096)
 def string_isoauto_to_date(datetime_string) -> datetime.datetime:
-    try:
+    ## select parser by format markers instead of catching exceptions
+    if datetime_string.endswith("Z") and datetime_string[10:11] == "T":
+        if "." in datetime_string:
+            return string_isoz_to_date(datetime_string)
         return string_iso2_to_date(datetime_string)
-    except ValueError:
-        pass
-    try:
-        return string_isoz_to_date(datetime_string)
-    except ValueError:
-        pass
     return string_iso_to_date(datetime_string)
 
 
+@functools.lru_cache(maxsize=4096)
 def string_to_date(date_string) -> datetime.datetime:
     item_date = datetime.datetime.strptime(date_string, "%Y-%m-%d")
     return add_timezone(item_date)
 
 
+@functools.lru_cache(maxsize=4096)
 def string_to_datetime(datetime_string) -> datetime.datetime:
     item_date = datetime.datetime.strptime(datetime_string, "%Y-%m-%d %H:%M:%S")
     return add_timezone(item_date)
 
 
+## time zone object is resolved once
+LOCAL_TIMEZONE = pytz.timezone("Europe/Warsaw")
+
+
 def add_timezone(dt: datetime.datetime) -> datetime.datetime:
-    tz_info = pytz.timezone("Europe/Warsaw")
-    return tz_info.localize(dt)
+    return LOCAL_TIMEZONE.localize(dt)
 
 
 def convert_to_html(content: str, *, preserve_newline=False) -> str:
@@ -128,70 +164,129 @@ def read_data(file_path):
 
 
 def write_data(file_path, content):
-    with open(file_path, "w", encoding="utf8") as fp:
-        fp.write(content)
+    ## encode whole content at once and skip text layer
+    data = content.encode("utf8")
+    with open(file_path, "wb") as fp:
+        fp.write(data)
+
+
+## write file only if content differs from existing file
+## returns True if file was written
+def write_data_if_changed(file_path, content) -> bool:
+    data = content.encode("utf8")
+    try:
+        if Path(file_path).stat().st_size == len(data):
+            with open(file_path, "rb") as fp:
+                if fp.read() == data:
+                    return False
+    except OSError:
+        ## file does not exist or can not be read
+        pass
+    with open(file_path, "wb") as fp:
+        fp.write(data)
+    return True
 
 
 def calculate_dict_hash(data_dict):
     data_str = json.dumps(data_dict, sort_keys=True)
     data_bytes = data_str.encode("utf-8")
-    # ruff: noqa: S324
-    return hashlib.md5(data_bytes).hexdigest()  # nosec
+    return calculate_bytes_hash(data_bytes)
 
 
 def calculate_hash(data_string):
     data_bytes = data_string.encode("utf-8")
-    # ruff: noqa: S324
-    return hashlib.md5(data_bytes).hexdigest()  # nosec
-
+    return calculate_bytes_hash(data_bytes)
 
-## =====================================================
 
+## BLAKE2 is faster than MD5, 16 bytes digest keeps length of hex string (32 characters)
+def calculate_bytes_hash(data_bytes):
+    return hashlib.blake2b(data_bytes, digest_size=16).hexdigest()
 
-class ObjRepr:
-    def __init__(self):
-        self._visited = set()
 
-    def repr_obj(self, obj):
-        self._visited.clear()
-        return self._visit(obj)
+## =====================================================
 
-    # ruff: noqa: C901, PLR0911
-    def _visit(self, obj):
-        obj_id = id(obj)
-        if obj_id in self._visited:
-            # print("visited:", type(next_obj), next_obj)
-            return obj
-        self._visited.add(obj_id)
 
-        if isinstance(obj, dict):
-            ret_dict = {}
-            for key, data in obj.items():
-                ret_dict[key] = self._visit(data)
-            return ret_dict
-
-        if hasattr(obj, "__dict__"):
-            ret_dict = {"___type___": type(obj).__name__, "___id___": id(obj)}
-            for key, data in obj.__dict__.items():
-                ret_dict[key] = self._visit(data)
-            return ret_dict
-
-        if hasattr(obj, "__slots__"):
-            ret_dict = {"___type___": type(obj).__name__, "___id___": id(obj)}
-            for key in obj.__slots__:
-                data = getattr(obj, key)
-                ret_dict[key] = self._visit(data)
-            return ret_dict
-
-        if isinstance(obj, str):
-            return obj
-
-        if isinstance(obj, Iterable):
-            return [self._visit(data) for data in obj]
+## kinds of objects handled by ObjRepr
+OBJ_KIND_DICT = 0
+OBJ_KIND_OBJECT = 1
+OBJ_KIND_SLOTS = 2
+OBJ_KIND_ITERABLE = 3
+OBJ_KIND_LEAF = 4
 
-        return obj
+## key: type of object
+## value: kind of object
+OBJ_KIND_CACHE: dict[type, int] = {}
 
 
+## kind depends on type of object, so it is detected once per type
+def get_obj_kind(obj) -> int:
+    obj_type = type(obj)
+    obj_kind = OBJ_KIND_CACHE.get(obj_type)
+    if obj_kind is None:
+        if isinstance(obj, dict):
+            obj_kind = OBJ_KIND_DICT
+        elif hasattr(obj, "__dict__"):
+            obj_kind = OBJ_KIND_OBJECT
+        elif hasattr(obj, "__slots__"):
+            obj_kind = OBJ_KIND_SLOTS
+        elif isinstance(obj, str):
+            obj_kind = OBJ_KIND_LEAF
+        elif isinstance(obj, Iterable):
+            obj_kind = OBJ_KIND_ITERABLE
+        else:
+            obj_kind = OBJ_KIND_LEAF
+        OBJ_KIND_CACHE[obj_type] = obj_kind
+    return obj_kind
+
+
+## returns representation of object and list of children to fill the representation
+def visit_obj_item(obj, visited: set[int]):
+    obj_kind = get_obj_kind(obj)
+    obj_id = id(obj)
+    if obj_kind == OBJ_KIND_LEAF or obj_id in visited:
+        ## leaves are returned as they are and can not form cycles - no need to track them
+        return obj, ()
+    visited.add(obj_id)
+
+    if obj_kind == OBJ_KIND_DICT:
+        ret_dict: dict[str, Any] = {}
+        return ret_dict, [(data, ret_dict, key) for key, data in obj.items()]
+
+    if obj_kind == OBJ_KIND_OBJECT:
+        ret_dict = {"___type___": type(obj).__name__, "___id___": obj_id}
+        return ret_dict, [(data, ret_dict, key) for key, data in obj.__dict__.items()]
+
+    if obj_kind == OBJ_KIND_SLOTS:
+        ret_dict = {"___type___": type(obj).__name__, "___id___": obj_id}
+        return ret_dict, [(getattr(obj, key), ret_dict, key) for key in obj.__slots__]
+
+    if obj_kind == OBJ_KIND_ITERABLE:
+        items_list = list(obj)
+        ret_list = [None] * len(items_list)
+        return ret_list, [(data, ret_list, index) for index, data in enumerate(items_list)]
+
+    return obj, ()
+
+
+## walk with explicit stack instead of recursion (deep structures do not reach recursion limit)
+## objects are visited in the same order as in recursive walk
 def obj_to_dict(obj):
-    repr_obj = ObjRepr()
-    return repr_obj.repr_obj(obj)
+    if get_obj_kind(obj) == OBJ_KIND_LEAF:
+        ## nothing to walk
+        return obj
+    visited: set[int] = set()
+    root = [None]
+    ## items: (object, container of representation, key in container)
+    stack = [(obj, root, 0)]
+    while stack:
+        item, container, key = stack.pop()
+        item_repr, children = visit_obj_item(item, visited)
+        container[key] = item_repr
+        stack.extend(reversed(children))
+    return root[0]
+
+
+## kept for compatibility, see obj_to_dict()
+class ObjRepr:
+    def repr_obj(self, obj):
+        return obj_to_dict(obj)
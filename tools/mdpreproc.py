@@ -16,15 +16,19 @@
 #
 
 import argparse
+import html
 import logging
 import os
 import re
 
-import xmltodict
-
 
 _LOGGER = logging.getLogger(__name__)
 
+INSERT_TAG_REGEX = re.compile("<!--.*?(insertstart|insertend).*?-->", re.DOTALL)
+
+## XML attribute: name="value" or name='value'
+ATTRIBUTE_REGEX = re.compile(r"""([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
 
 class MDPreprocessor:
     def __init__(self):
@@ -56,24 +60,29 @@ class MDPreprocessor:
                     raise RuntimeError(message)
 
         # we are sure that there is no nested placeholders
-        self._output_content = content
-        replace_list = sorted(replace_list, key=lambda item: item[0].start(), reverse=True)
-        for replace_pair in replace_list:
-            self._replace(*replace_pair)
+        # output is built in single pass from parts of original content and inserted contents
+        replace_list = sorted(replace_list, key=lambda item: item[0].start())
+        content_parts = []
+        last_index = 0
+        for start_item, end_item in replace_list:
+            content_parts.append(content[last_index : start_item.end()])
+            content_parts.append(self._prepare_insert(start_item, end_item))
+            last_index = end_item.start()
+        content_parts.append(content[last_index:])
+        self._output_content = "".join(content_parts)
 
         # _LOGGER.info("new content:\n%s", self._output_content)
         save_content(md_path, self._output_content)
 
-    def _replace(self, start_item, end_item):
+    ## returns content to insert between given tags
+    def _prepare_insert(self, start_item, end_item):
         _LOGGER.info("handling pair: %s %s", start_item, end_item)
-        # convert HTML comment to valid XML tag
+        # extract attributes from HTML comment
         tag_text = start_item.group()
         tag_text = tag_text.replace("<!--", "")
         tag_text = tag_text.replace("-->", "")
         tag_text = tag_text.replace("insertstart", "")
-        tag_text = f"<insertstart {tag_text}></insertstart>"
-        attr_dict = xmltodict.parse(tag_text)
-        attr_dict = attr_dict.get("insertstart", {})
+        attr_dict = parse_attributes(tag_text)
         _LOGGER.info("found attributes: %s", attr_dict)
 
         include_path = attr_dict.get("@include")
@@ -86,60 +95,64 @@ class MDPreprocessor:
         if not os.path.isabs(include_path):
             include_path = os.path.join(self._base_dir, include_path)
         include_content = load_content(include_path)
+        return f"{pre_content}{include_content}{post_content}"
 
-        space_start_index = start_item.end()
-        space_end_index = end_item.start()
-        content_before = self._output_content[:space_start_index]
-        content_after = self._output_content[space_end_index:]
-        self._output_content = f"{content_before}{pre_content}{include_content}{post_content}{content_after}"
-
+    ## single pass over tags - 'insertstart' tag has to be directly followed by 'insertend' tag
     def _find_replace_list(self):
         replace_list = []
-        while True:
-            replace_pair = self._find_replace_item(0)
-            if not replace_pair:
+        items_num = len(self._items)
+        curr_index = 0
+        while curr_index < items_num:
+            curr_item = self._items[curr_index]
+            if "insertstart" not in curr_item.group():
+                # looking for insertstart
+                curr_index += 1
+                continue
+            next_index = curr_index + 1
+            if next_index >= items_num:
                 break
-            replace_list.append(replace_pair)
+            next_item = self._items[next_index]
+            # looking for insertend (otherwise both tags are skipped)
+            if "insertend" in next_item.group():
+                # curr_item - insertstart
+                # next_item - insertend
+                replace_list.append((curr_item, next_item))
+            curr_index = next_index + 1
         return replace_list
 
-    def _find_replace_item(self, curr_index):
-        if curr_index >= len(self._items):
-            return ()
-        curr_item = self._items[curr_index]
-        if "insertstart" not in curr_item.group():
-            # looking for insertstart
-            return self._find_replace_item(curr_index + 1)
-        next_index = curr_index + 1
-        if next_index >= len(self._items):
-            return ()
-        next_item = self._items[next_index]
-        if "insertend" not in next_item.group():
-            # looking for insertend
-            return self._find_replace_item(next_index + 1)
-        # curr_item - insertstart
-        # next_item - insertend
-        del self._items[next_index]
-        del self._items[curr_index]
-        return (curr_item, next_item)
-
     def _find_tags(self):
-        tag_list = []
-        start_pattern = re.compile("<!--.*?(insertstart|insertend).*?-->", re.MULTILINE | re.DOTALL)
-        tag_list = list(start_pattern.finditer(self._input_content))  ## copy list
-        self._items = sorted(tag_list, key=lambda item: item.start())
+        ## finditer() returns matches in order of position - no sorting needed
+        self._items = list(INSERT_TAG_REGEX.finditer(self._input_content))
 
 
 # ==============================================
 
 
+WHITESPACE_TO_SPACE = str.maketrans({"\r": " ", "\n": " ", "\t": " "})
+
+
+## returns dict of attributes in the same form as 'xmltodict' (names prefixed with '@')
+def parse_attributes(tag_text):
+    attr_dict = {}
+    for name, double_value, single_value in ATTRIBUTE_REGEX.findall(tag_text):
+        value = double_value or single_value
+        ## normalize whitespaces the same way XML parser does, then resolve entities
+        value = value.replace("\r\n", " ")
+        value = value.translate(WHITESPACE_TO_SPACE)
+        attr_dict[f"@{name}"] = html.unescape(value)
+    return attr_dict
+
+
 def load_content(file_path):
     with open(file_path, encoding="utf-8") as file:
         return file.read()
 
 
 def save_content(file_path, content):
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write(content)
+    ## encode whole content at once and skip text layer
+    data = content.encode("utf-8")
+    with open(file_path, "wb") as file:
+        file.write(data)
 
 
 def main():